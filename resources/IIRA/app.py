@@ -31,6 +31,7 @@ class App(tk.Tk):
         self.text = []
         self.formatted_text = []
         self.labels = {} # Label pro Text und Rater
+        self.help_frames = {} # Wiederverwendete Hilfefenster pro Hilfefenster-Klasse
 
         self.title("IIRA")
         self.geometry("1500x750")
@@ -53,6 +54,7 @@ class App(tk.Tk):
     def show_frame(self, frame_name):
         frame = self.frames[frame_name]
         frame.tkraise()
+        frame.on_show()
     
     def load_icons(self):
         self.app_icon = ImageTk.PhotoImage(file=os.path.join(file_path, "data/icons/intrarater_512px.png"))
@@ -77,8 +79,8 @@ class App(tk.Tk):
     
     def init_frames(self):
         for frame in self.frames:
-            for widget in self.frames[frame].winfo_children():
-                widget.destroy()
+            # Das Frame als Ganzes zerstören, statt jedes Kind-Widget einzeln.
+            self.frames[frame].destroy()
 
         main_frame = MainFrame(self)
         self.init_root_frame(main_frame)
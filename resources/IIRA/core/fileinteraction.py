@@ -13,10 +13,15 @@ from core.metrics import map_metrics
 PROFILE = 0
 RATING = 1
 
+def is_named_column(column):
+    # Pandas benennt Spalten ohne Header mit "Unnamed: n".
+    return not str(column).startswith("Unnamed")
+
 class FileValidation():
     def __init__(self, file, scale_format):
         self.debug = False
         file_extension = pathlib.Path(file).suffix
+        self.file = file    # Pfad der importierten Datei, z.B. für die Zuordnung der Sicherungskopie
         self.content = None
         self.format = None
 
@@ -27,14 +32,13 @@ class FileValidation():
         self.formatted_text = []
         self.labels = {}
 
+        # Spalten ohne Header werden bereits beim Einlesen verworfen, statt sie erst zu laden und danach zu filtern.
         if file_extension == ".xlsx" or file_extension == ".xls":
-            self.content = pd.read_excel(file)
+            self.content = pd.read_excel(file, usecols=is_named_column)
         elif file_extension == ".ods":
-            self.content = pd.read_excel(file, engine="odf")
+            self.content = pd.read_excel(file, engine="odf", usecols=is_named_column)
         else:
-            self.content = pd.read_csv(file, delimiter=";")
-
-        self.content = self.content.loc[:, ~self.content.columns.str.contains("^Unnamed")]
+            self.content = pd.read_csv(file, delimiter=";", usecols=is_named_column)
         
         self.check_format()
         if self.scale_format == "nominal" or self.scale_format == "ordinal":
@@ -70,7 +74,8 @@ class FileValidation():
         headers = list(self.content.columns)
 
         for header in headers:
-            header = header.lower()
+            # Header können z.B. in Excel-Dateien auch Zahlen sein.
+            header = str(header).lower()
             if header == "Rater ID".lower():
                 self.format = "Format 1"
                 return
@@ -241,6 +246,8 @@ class FileValidation():
         return "ir_app_" + user
 
     def nlp(self, text):
+        # Zellen und Header können Zahlen enthalten; angezeigt wird immer ein String.
+        text = str(text)
         sentisurvey_metadata = "How would you label the following sentences regarding its polarity? Rate the sentences as positive, negative or neutral (neither positive nor negative) based on your perception."
         if sentisurvey_metadata in text:
             text = max(re.findall(re.escape("[")+"(.*?)"+re.escape("]"),text), key=len)
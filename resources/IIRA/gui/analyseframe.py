@@ -3,6 +3,7 @@ from tkinter import ttk, messagebox
 from math import isnan
 
 from gui.containerframe import ContainerFrame
+from gui.constants import FILE_TYPES
 from gui.helperframes import ScrollFrame, PrepAnalyseHelpFrame, ResultsHelpFrame
 from core.create_analyses import CreateAnalyses
 from core.fileinteraction import write_excel
@@ -227,7 +228,7 @@ class AnalyseFrame(ContainerFrame):
             btn.config(text="Alle abwählen")
 
     def help_cmd(self,event=None):
-        PrepAnalyseHelpFrame(self.container)
+        PrepAnalyseHelpFrame.show(self.container)
 
     def update_frame(self):
         self.populate_rater_container()
@@ -459,11 +460,7 @@ class ResultsFrame(ContainerFrame):
 
     def export_cmd(self):
 
-        filename = tk.filedialog.asksaveasfilename(filetypes=[
-            ("Excel files", ".xlsx .xls"), 
-            ("Libreoffice Calc files", ".ods"),
-            ("Csv files", ".csv")
-            ])
+        filename = tk.filedialog.asksaveasfilename(filetypes=FILE_TYPES)
         write_excel(self.reliability_analyses, selected_intra_ids, selected_intra_metrics, selected_inter_ids, 
                     selected_inter_metrics, self.container.scale_format, filename) # TODO path abfragen
 
@@ -473,7 +470,7 @@ class ResultsFrame(ContainerFrame):
         """
         # Jedes Frame erzeugt ein HelpFrame mit eigenen Inhalten.
         # Wird in den vererbten Klassen implementiert.
-        ResultsHelpFrame(self.container)
+        ResultsHelpFrame.show(self.container)
 
     def update_frame(self):
         """
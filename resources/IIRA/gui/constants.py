@@ -0,0 +1,6 @@
+# Gemeinsame Konstanten der GUI-Module.
+
+# Unterstützte Dateiformate für Import und Export.
+FILE_TYPES = (("Excel files", ".xlsx .xls"),
+              ("Libreoffice Calc files", ".ods"),
+              ("Csv files", ".csv"))
@@ -4,6 +4,7 @@ import shutil
 import os
 
 from gui.helperframes import ProfileFrame
+from gui.fonts import get_font
 
 class ContainerFrame(ttk.Frame):
     def __init__(self, container):
@@ -17,14 +18,14 @@ class ContainerFrame(ttk.Frame):
     def init_menu_bar(self):
         # GUI-Elemente
         home_frame = ttk.Frame(self.menu_bar, width=65, height=50)
-        home_label = ttk.Label(home_frame, text="Home", image=self.container.home_icon, compound="top", font="Arial 12")
+        home_label = ttk.Label(home_frame, text="Home", image=self.container.home_icon, compound="top", font=get_font(12))
         home_frame.bind("<Enter>", lambda x: self.on_enter(home_frame, home_label))
         home_frame.bind("<Leave>", lambda x: self.on_leave(home_frame, home_label))
         home_label.bind("<Button-1>", lambda x: self.home_cmd())
         home_frame.bind("<Button-1>", lambda x: self.home_cmd())
 
         profile_frame = ttk.Frame(self.menu_bar, width=65, height=50)
-        profile_label = ttk.Label(profile_frame, text="Profil", image=self.container.profile_icon, compound="top", font="Arial 12")
+        profile_label = ttk.Label(profile_frame, text="Profil", image=self.container.profile_icon, compound="top", font=get_font(12))
         profile_frame.bind("<Enter>", lambda x: self.on_enter(profile_frame, profile_label))
         profile_frame.bind("<Leave>", lambda x: self.on_leave(profile_frame, profile_label))
         #TODO Profil wechseln
@@ -35,7 +36,7 @@ class ContainerFrame(ttk.Frame):
         vert_separator = ttk.Separator(self.menu_bar, orient="vertical")
         
         self.help_frame = ttk.Frame(self.menu_bar, width=65, height=50)
-        self.help_label = ttk.Label(self.help_frame, text="Hilfe", image=self.container.help_icon, compound="top", font="Arial 12")
+        self.help_label = ttk.Label(self.help_frame, text="Hilfe", image=self.container.help_icon, compound="top", font=get_font(12))
         self.help_label.bind("<Enter>", lambda x: self.on_enter(self.help_frame, self.help_label))
         self.help_label.bind("<Leave>", lambda x: self.on_leave(self.help_frame, self.help_label))
         self.help_frame.bind("<Button-1>", self.help_cmd)
@@ -53,12 +54,12 @@ class ContainerFrame(ttk.Frame):
         #color_label.place(relx=0.5, rely=0.5, anchor="center")
         self.help_label.place(relx=0.5, rely=0.5, anchor="center")
 
-    def on_enter(self, frame, label):
+    def on_enter(self, frame, label, event=None):
         if frame is not None:
             frame.configure(style="TopFrame.TFrame")
         label["background"] = self.accent_color
 
-    def on_leave(self, frame, label):
+    def on_leave(self, frame, label, event=None):
         if frame is not None:
             frame.configure(style="TFrame")
         label["background"] = ttk.Style().lookup("TFrame", "background")
@@ -77,7 +78,7 @@ class ContainerFrame(ttk.Frame):
         columnspan = max(len(headings) * 2, 2)
         index = 0
         for heading in headings:
-            heading_lbl = ttk.Label(parent, text=heading, font="Arial 15 bold")
+            heading_lbl = ttk.Label(parent, text=heading, font=get_font(15, "bold"))
             heading_lbl.grid(row=0, column=index)
 
             if heading != headings[-1]: 
@@ -93,7 +94,7 @@ class ContainerFrame(ttk.Frame):
             index = 0
             for cell in row:
                 if isinstance(cell, str):
-                    cell_lbl = ttk.Label(parent, text=cell, font="Arial 15")
+                    cell_lbl = ttk.Label(parent, text=cell, font=get_font(15))
                     cell_lbl.grid(row=i, column=index, pady=5)
                 elif isinstance(cell, list):
                     pass
@@ -116,3 +117,8 @@ class ContainerFrame(ttk.Frame):
         
     def update_frame(self):
         raise NotImplementedError       # Wird in den vererbten Klassen implementiert.
+
+    def on_show(self):
+        # Wird von App.show_frame aufgerufen, sobald das Frame angezeigt wird.
+        # Vererbte Klassen können hier verzögerte Inhalte erzeugen.
+        pass
@@ -1,15 +1,73 @@
+import os
+import zipfile
+import logging
+from collections import namedtuple
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import tkinter.font as font
 
 from gui.containerframe import ContainerFrame
+from gui.fonts import get_font
+from gui.constants import FILE_TYPES
 from gui.helperframes import ScaleHelpFrame, ImportHelpFrame
 from core.fileinteraction import FileValidation
 
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Skalenformat -> Typ der Formatvorschau
+SCALE_TYPES = {"nominal": "discrete", "ordinal": "discrete", "intervall": "continuous", "ratio": "continuous"}
+
+# Inhalt der Formatvorschau je Skalentyp und Format; wird einmalig beim Import erzeugt.
+FormatSpec = namedtuple("FormatSpec", ["headings", "content", "bullets", "pady"])
+
+FORMAT_SPECS = {
+    ("discrete", "format_1"): FormatSpec(
+        ("Categories", "Rater ID", "Sentiment Analysis\nis nice!", "If I run the code in\nthe GUI, it just hangs."),
+        (("positive", "Alice", "positive", "neutral"),
+         ("neutral", "Bob", "positive", "negative"),
+         ("negative",)),
+        "• Header \"Rater ID\" muss in Datei vorkommen.", 5),
+    ("discrete", "format_2"): FormatSpec(
+        ("Categories", "Subject", "Alice", "Bob"),
+        (("positive", "Sentiment Analysis\nis nice!", "positive", "positive"),
+         ("neutral", "If I run the code in\nthe GUI, it just hangs.", "neutral", "negative"),
+         ("negative",)),
+        "• Header \"Subject\" muss in Datei vorkommen.", 5),
+    ("continuous", "format_1"): FormatSpec(
+        ("Rater ID", "Herzfrequenz\n24.01. 16:30", "Herzfrequenz\n24.01. 17:00"),
+        (("Alice", "121.5", "89"),
+         ("Bob", "123", "75")),
+        "• Header \"Rater ID\" muss in Datei vorkommen.", 15),
+    ("continuous", "format_2"): FormatSpec(
+        ("Subject", "Alice", "Bob"),
+        (("Herzfrequenz\n24.01. 16:30", "121.5", "123"),
+         ("Herzfrequenz\n24.01. 17:00", "89", "75")),
+        "• Header \"Subject\" muss in Datei vorkommen.", 15),
+}
+
+# Aufzählung unter beiden Formaten je Skalenformat.
+CATEGORY_BULLETS = ("• Header \"Categories\" in beiden Formaten.",
+                    "• Spalten mit schwarzen Header werden automatisch erkannt.\n"
+                    "• Andere Spalten werden ignoriert.")
+CONTINUOUS_BULLETS = ("• Spalten die davor auftauchen werden ignoriert.\n"
+                      "• Danach ausschließlich Spalten mit den Messergebnissen.")
+BULLETLIST_TEXTS = {
+    "nominal": "\n".join((CATEGORY_BULLETS[0],
+                          "• Kategorienamen angeben; hier: positive, neutral, negative.",
+                          CATEGORY_BULLETS[1])),
+    "ordinal": "\n".join((CATEGORY_BULLETS[0],
+                          "• Kategorienamen in sortierter Reihenfolge angeben.\n  (aufsteigend, oder absteigend)",
+                          CATEGORY_BULLETS[1])),
+    "intervall": CONTINUOUS_BULLETS,
+    "ratio": CONTINUOUS_BULLETS,
+}
+
 
 class ScaleFrame(ContainerFrame):
+    styles_configured = False   # Styles sind global und müssen nur einmal konfiguriert werden.
+
     def __init__(self, container):
         super().__init__(container)
         self.scale_types = ["nominal", "ordinal", "intervall", "ratio"]
@@ -19,7 +77,9 @@ class ScaleFrame(ContainerFrame):
 
         self.selected_weight = tk.StringVar()
 
-        container.style.configure("FileFrame.TMenubutton", font="Arial 18", foreground="black", width=10)
+        if not ScaleFrame.styles_configured:
+            container.style.configure("FileFrame.TMenubutton", font="Arial 18", foreground="black", width=10)
+            ScaleFrame.styles_configured = True
 
         self.center_container = ttk.Frame(self, style="Card", padding=(5, 6, 7, 8))
         next_button = ttk.Button(self.center_container, text="Weiter", style="FileFrame.TButton",
@@ -39,7 +99,39 @@ class ScaleFrame(ContainerFrame):
         self.center_container.rowconfigure(2, weight=1)
         self.center_container.rowconfigure(3, weight=1)
 
+        # Labels und Auswahlmenüs werden einmalig erzeugt und je nach Modus nur ein-, bzw. ausgeblendet.
+        self.current_mode = None
+        self.shown_widgets = []
+        self.scaletype_widgets = self.create_scaletype_widgets()
+        self.weights_widgets = self.create_weights_widgets()
+
+    def create_weights_widgets(self):
+        weights_label = ttk.Label(self.center_container, font=get_font(22),
+                                text="Gewichte")
+        # Ein mehrzeiliges Label statt eines Labels pro Aufzählungspunkt.
+        weights_infolabel = ttk.Label(self.center_container, font=get_font(18), justify="left",
+                                text="• Legen fest in welchem Verhältnis die Kategorien zueinander stehen.\n"
+                                     "• Identity entspricht den ungewichteten Metriken.\n  Übereinstimmung nur dann, wenn exakt die gleiche\n  Kategorie ausgewählt wurde.\n"
+                                     "• Üblich sind die Gewichte identity, linear, oder quadratic.")
+
+        weights_menu = ttk.OptionMenu(self.center_container, self.selected_weight, "identity", *self.weights,
+                                    style="FileFrame.TMenubutton")
+
+        return {"title": weights_label, "menu": weights_menu, "info": weights_infolabel}
+
+    def create_scaletype_widgets(self):
+        scale_format_label = ttk.Label(self.center_container, font=get_font(22),
+                                text="Skalenformat")
+        scale_format_infolabel = ttk.Label(self.center_container, font=get_font(18), justify="left",
+                                text="• Nominalskala: Objekte werden nur mit Namen versehen.\n"
+                                     "• Ordinalskala: Es gibt zusätzlich eine Äquivalenz- und\n  Ordungsrelation.\n"
+                                     "• Intervallskala: Zusätzlich sind Abstände/Intervall definierbar.\n"
+                                     "• Rationalskala: Es gibt zusätzlich einen Nullpunkt.")
 
+        scale_menu = ttk.OptionMenu(self.center_container, self.selected_scale, "nominal", *self.scale_types,
+                                    style="FileFrame.TMenubutton")
+
+        return {"title": scale_format_label, "menu": scale_menu, "info": scale_format_infolabel}
 
     def populate_frame(self, mode):
         if mode == "analyse":
@@ -49,54 +141,19 @@ class ScaleFrame(ContainerFrame):
             self.populate_scaletype()
     
     def populate_weights(self):
-            weights_label = ttk.Label(self.center_container, font="Arial 22",
-                                    text="Gewichte")
-            weights_menu = ttk.OptionMenu(self.center_container, self.selected_weight, "identity", *self.weights,
-                                        style="FileFrame.TMenubutton")
-            
-            infolabel_container = ttk.Frame(self.center_container)
-            weights_infolabel = ttk.Label(infolabel_container, font="Arial 18",
-                                    text="• Legen fest in welchem Verhältnis die Kategorien zueinander stehen.")
-            identity_infolabel = ttk.Label(infolabel_container, font="Arial 18",
-                                    text="• Identity entspricht den ungewichteten Metriken.\n  Übereinstimmung nur dann, wenn exakt die gleiche\n  Kategorie ausgewählt wurde. ")
-            linear_infolabel = ttk.Label(infolabel_container, font="Arial 18",
-                                    text="• Üblich sind die Gewichte identity, linear, oder quadratic.")
-            
-            weights_label.grid(row=0, column=1, pady=10)
-            weights_menu.grid(row=1, column=1, pady=20)
-            infolabel_container.grid(row=2, column=1, pady=10)
-
-            weights_infolabel.pack(fill="x", pady=5)
-            identity_infolabel.pack(fill="x", pady=5)
-            linear_infolabel.pack(fill="x", pady=5)
+            self.weights_widgets["title"].grid(row=0, column=1, pady=10)
+            self.weights_widgets["menu"].grid(row=1, column=1, pady=20)
+            self.weights_widgets["info"].grid(row=2, column=1, pady=10)
 
+            self.shown_widgets.extend(self.weights_widgets.values())
             self.center_container.columnconfigure(0, weight=1)
 
     def populate_scaletype(self):
-            scale_format_label = ttk.Label(self.center_container, font="Arial 22",
-                                    text="Skalenformat")
-            scale_menu = ttk.OptionMenu(self.center_container, self.selected_scale, "nominal", *self.scale_types,
-                                        style="FileFrame.TMenubutton")
-            
-            infolabel_container = ttk.Frame(self.center_container)
-            nominal_infolabel = ttk.Label(infolabel_container, font="Arial 18",
-                                    text="• Nominalskala: Objekte werden nur mit Namen versehen.")
-            ordinal_infolabel = ttk.Label(infolabel_container, font="Arial 18",
-                                    text="• Ordinalskala: Es gibt zusätzlich eine Äquivalenz- und\n  Ordungsrelation.")
-            intervall_infolabel = ttk.Label(infolabel_container, font="Arial 18",
-                                    text="• Intervallskala: Zusätzlich sind Abstände/Intervall definierbar.")
-            rational_infolabel = ttk.Label(infolabel_container, font="Arial 18",
-                                    text="• Rationalskala: Es gibt zusätzlich einen Nullpunkt.")
-            
-            scale_format_label.grid(row=0, column=0, pady=10)
-            scale_menu.grid(row=1, column=0, pady=20)
-            infolabel_container.grid(row=2, column=0, pady=10)
-
-            nominal_infolabel.pack(fill="x", pady=5)
-            ordinal_infolabel.pack(fill="x", pady=5)
-            intervall_infolabel.pack(fill="x", pady=5)
-            rational_infolabel.pack(fill="x", pady=5)
+            self.scaletype_widgets["title"].grid(row=0, column=0, pady=10)
+            self.scaletype_widgets["menu"].grid(row=1, column=0, pady=20)
+            self.scaletype_widgets["info"].grid(row=2, column=0, pady=10)
 
+            self.shown_widgets.extend(self.scaletype_widgets.values())
             self.center_container.columnconfigure(0, weight=1)
     
     def next_cmd(self):
@@ -108,33 +165,44 @@ class ScaleFrame(ContainerFrame):
         self.container.show_frame("FileFrame")
     
     def help_cmd(self,event=None):
-        ScaleHelpFrame(self.container)
+        ScaleHelpFrame.show(self.container)
 
     def update_frame(self):
-        for widget in self.center_container.winfo_children():
-            if not isinstance(widget, tk.ttk.Button) and not isinstance(widget, tk.Frame):
-                widget.destroy()
+        if self.container.mode == self.current_mode:
+            # Modus unverändert; die bereits angezeigten Widgets können übernommen werden.
+            return
+        self.current_mode = self.container.mode
+
+        # Nur die zuvor angezeigten Widgets ausblenden; Button und Separator bleiben unberührt.
+        for widget in self.shown_widgets:
+            widget.grid_remove()
+        self.shown_widgets.clear()
         self.populate_frame(self.container.mode)
 
 
 class FileFrame(ContainerFrame):
+    styles_configured = False   # Styles sind global und müssen nur einmal konfiguriert werden.
+    last_dir = None             # Zuletzt genutztes Verzeichnis; bleibt auch nach dem Home-Button erhalten.
+
     def __init__(self, container):
         super().__init__(container)
-        container.style.configure("FileFrame.TButton", font="Arial 18", foreground="black")
+        if not FileFrame.styles_configured:
+            container.style.configure("FileFrame.TButton", font="Arial 18", foreground="black")
+            FileFrame.styles_configured = True
 
         center_container = ttk.Frame(self, style="Card", padding=(5, 6, 7, 8))
-        file_import_label = ttk.Label(center_container, font="Arial 20",
+        file_import_label = ttk.Label(center_container, font=get_font(20),
                                 text="Datei importieren")
-        accepted_formats_label = ttk.Label(center_container, font="Arial 20",
+        accepted_formats_label = ttk.Label(center_container, font=get_font(20),
                                 text="Es werden zwei Formate akzeptiert")
         
-        format_1_label = ttk.Label(center_container, font="Arial 20",
+        format_1_label = ttk.Label(center_container, font=get_font(20),
                                 text="Format 1:")
         
         self.format_1_container = ttk.Frame(center_container)
         self.format_1_bulletlist_container = ttk.Frame(center_container)
     
-        format_2_label = ttk.Label(center_container, font="Arial 20",
+        format_2_label = ttk.Label(center_container, font=get_font(20),
                                 text="Format 2:")
 
         self.format_2_container = ttk.Frame(center_container)
@@ -173,101 +241,57 @@ class FileFrame(ContainerFrame):
         center_container.columnconfigure(1, weight=1)
         center_container.rowconfigure(6, weight=1)
 
-
-    def populate_format_preview(self, format_container):
-        if self.container.scale_format == "nominal" or self.container.scale_format == "ordinal":
-            if format_container == self.format_1_container:
-                headings = ["Categories", "Rater ID", "Sentiment Analysis\nis nice!", "If I run the code in\nthe GUI, it just hangs."]
-                content = [["positive", "Alice", "positive", "neutral"],
-                            ["neutral", "Bob", "positive", "negative"],
-                            ["negative"]]
-            
-                self.create_table(self.format_1_container, headings, content)
-
-                rater_id_infolabel = ttk.Label(self.format_1_bulletlist_container, font="Arial 18",
-                        text="• Header \"Rater ID\" muss in Datei vorkommen.")
-                rater_id_infolabel.pack(fill="x", pady=5)
-            else:
-                headings = ["Categories", "Subject", "Alice", "Bob"]
-                content = [["positive", "Sentiment Analysis\nis nice!", "positive", "positive"],
-                            ["neutral", "If I run the code in\nthe GUI, it just hangs.", "neutral", "negative"],
-                            ["negative"]]
-            
-                self.create_table(self.format_2_container, headings, content)
-
-                text_infolabel = ttk.Label(self.format_2_bulletlist_container, font="Arial 18",
-                                        text="• Header \"Subject\" muss in Datei vorkommen.")
-                text_infolabel.pack(fill="x", pady=5)
-                
-                categories_infolabel = ttk.Label(self.format_1_2_bulletlist_container, font="Arial 18",
-                                        text="• Header \"Categories\" in beiden Formaten.")
-                
-                if self.container.scale_format == "nominal":
-                    info_txt = "• Kategorienamen angeben; hier: positive, neutral, negative."
-                else:
-                    info_txt = "• Kategorienamen in sortierter Reihenfolge angeben.\n  (aufsteigend, oder absteigend)"
-
-                category_entries_infolabel = ttk.Label(self.format_1_2_bulletlist_container, font="Arial 18",
-                                        text=info_txt)
-                black_headers_infolabel = ttk.Label(self.format_1_2_bulletlist_container, font="Arial 18",
-                                        text="• Spalten mit schwarzen Header werden automatisch erkannt.")
-                other_columns_infolabel = ttk.Label(self.format_1_2_bulletlist_container, font="Arial 18",
-                                        text="• Andere Spalten werden ignoriert.")
-
-                categories_infolabel.pack(fill="x", pady=5)
-                category_entries_infolabel.pack(fill="x", pady=5)
-                black_headers_infolabel.pack(fill="x", pady=5)
-                other_columns_infolabel.pack(fill="x", pady=5)
-        else:
-            if format_container == self.format_1_container:
-                headings = ["Rater ID", "Herzfrequenz\n24.01. 16:30", "Herzfrequenz\n24.01. 17:00"]
-                content = [["Alice", "121.5", "89"],
-                            ["Bob", "123", "75"]]
-            
-                self.create_table(self.format_1_container, headings, content)
-
-                rater_id_infolabel = ttk.Label(self.format_1_bulletlist_container, font="Arial 18",
-                        text="• Header \"Rater ID\" muss in Datei vorkommen.")
-                rater_id_infolabel.pack(fill="x", pady=15)
-            else:
-                headings = ["Subject", "Alice", "Bob"]
-                content = [["Herzfrequenz\n24.01. 16:30", "121.5", "123"],
-                            ["Herzfrequenz\n24.01. 17:00", "89", "75"]]
-            
-                self.create_table(self.format_2_container, headings, content)
-
-                text_infolabel = ttk.Label(self.format_2_bulletlist_container, font="Arial 18",
-                                        text="• Header \"Subject\" muss in Datei vorkommen.")
-                text_infolabel.pack(fill="x", pady=15)
-
-                other_columns_infolabel = ttk.Label(self.format_1_2_bulletlist_container, font="Arial 18",
-                                        text="• Spalten die davor auftauchen werden ignoriert.")
-                
-                subjects_infolabel = ttk.Label(self.format_1_2_bulletlist_container, font="Arial 18",
-                                        text="• Danach ausschließlich Spalten mit den Messergebnissen.")
-                
-                other_columns_infolabel.pack(fill="x", pady=15)
-                subjects_infolabel.pack(fill="x", pady=15)
+        # Die Vorschauen werden erst erzeugt, wenn das Frame angezeigt wird, und danach nur umgeschaltet.
+        self.preview_containers = (self.format_1_container, self.format_2_container,
+                                   self.format_1_bulletlist_container, self.format_2_bulletlist_container,
+                                   self.format_1_2_bulletlist_container)
+        self.format_previews = {}
+        self.bulletlist_labels = {}
+        self.current_preview = None
+        self.shown_scale_format = None
+        self.needs_repopulate = False
+
+    def create_format_preview(self, scale_type):
+        # Für jeden Container wird ein eigenes Frame erzeugt, das später als Ganzes ein- bzw. ausgeblendet wird.
+        preview = {}
+        for format_container in self.preview_containers:
+            preview[format_container] = ttk.Frame(format_container)
+        self.populate_format_preview(preview, scale_type)
+        return preview
+
+    def populate_format_preview(self, preview, scale_type):
+        for format_name, table_container, bulletlist_container in (
+                ("format_1", self.format_1_container, self.format_1_bulletlist_container),
+                ("format_2", self.format_2_container, self.format_2_bulletlist_container)):
+            spec = FORMAT_SPECS[(scale_type, format_name)]
+            self.create_table(preview[table_container], spec.headings, spec.content)
+            ttk.Label(preview[bulletlist_container], font=get_font(18), justify="left",
+                      text=spec.bullets).pack(fill="x", pady=spec.pady)
+
+        # Der Text hängt vom Skalenformat ab und wird in on_show gesetzt.
+        bulletlist_label = ttk.Label(preview[self.format_1_2_bulletlist_container], font=get_font(18), justify="left")
+        bulletlist_label.pack(fill="x", pady=spec.pady)
+        self.bulletlist_labels[scale_type] = bulletlist_label
 
 
     def select_file(self, container):
-        filename = tk.filedialog.askopenfilename(filetypes=[
-            ("Excel files", ".xlsx .xls"), 
-            ("Libreoffice Calc files", ".ods"),
-            ("Csv files", ".csv")
-            ])
+        filename = filedialog.askopenfilename(filetypes=FILE_TYPES, initialdir=FileFrame.last_dir)
 
         if filename == "":
             return
+        FileFrame.last_dir = os.path.dirname(filename)
 
         try:
             container.filevalidation = FileValidation(filename, self.container.scale_format)
             container.categories = container.filevalidation.categories
             container.rater_ids = container.filevalidation.rater_ids
-            container.text = container.filevalidation.text
-            container.formatted_text = container.filevalidation.formatted_text
+            # Texte werden nach dem Import nicht mehr verändert und daher als Tupel abgelegt.
+            container.text = tuple(container.filevalidation.text)
+            container.formatted_text = tuple(container.filevalidation.formatted_text)
             container.labels = container.filevalidation.labels
-        except:
+        except (OSError, ValueError, KeyError, ImportError, zipfile.BadZipFile):
+            # ValueError umfasst auch die Parser-Fehler von pandas und das fehlende Format aus check_format.
+            logger.exception("Import der Datei %s fehlgeschlagen", filename)
             messagebox.showerror(title="Error", message="Fehler beim importieren der Datei. Auf passendes Format geachtet?")
             return
 
@@ -288,21 +312,33 @@ class FileFrame(ContainerFrame):
     def help_cmd(self,event=None):
         # Jedes Frame erzeugt ein HelpFrame mit eigenen Inhalten.
         # Wird in den vererbten Klassen implementiert.
-        ImportHelpFrame(self.container)
+        ImportHelpFrame.show(self.container)
 
     def update_frame(self):
-        # Widgets aus vorheriger Session löschen, falls User über Home-Button den Frame erneut öffnet.
-        for widget in self.format_1_container.winfo_children():
-            widget.destroy()
-        for widget in self.format_2_container.winfo_children():
-            widget.destroy()
-        for widget in self.format_1_bulletlist_container.winfo_children():
-            widget.destroy()
-        for widget in self.format_2_bulletlist_container.winfo_children():
-            widget.destroy()
-        for widget in self.format_1_2_bulletlist_container.winfo_children():
-            widget.destroy()
-
-        # Frames neu befüllen
-        self.populate_format_preview(self.format_1_container)
-        self.populate_format_preview(self.format_2_container)
\ No newline at end of file
+        if self.container.scale_format == self.shown_scale_format:
+            # Skalenformat unverändert; die angezeigte Vorschau bleibt gültig.
+            return
+        # Die Vorschau wird erst in on_show aufgebaut, sobald das Frame tatsächlich sichtbar ist.
+        self.needs_repopulate = True
+
+    def on_show(self):
+        if not self.needs_repopulate:
+            return
+        self.needs_repopulate = False
+
+        scale_type = SCALE_TYPES[self.container.scale_format]
+        if scale_type not in self.format_previews:
+            self.format_previews[scale_type] = self.create_format_preview(scale_type)
+        self.bulletlist_labels[scale_type].configure(text=BULLETLIST_TEXTS[self.container.scale_format])
+        self.shown_scale_format = self.container.scale_format
+
+        if scale_type == self.current_preview:
+            return
+
+        # Vorschau der vorherigen Session ausblenden und die passende einblenden.
+        if self.current_preview is not None:
+            for frame in self.format_previews[self.current_preview].values():
+                frame.grid_remove()
+        for frame in self.format_previews[scale_type].values():
+            frame.grid(row=0, column=0, sticky="nsew")
+        self.current_preview = scale_type
@@ -0,0 +1,11 @@
+import tkinter.font as tkfont
+
+# Font-Objekte werden einmalig erzeugt und von allen Widgets geteilt, statt die Font-Beschreibung
+# bei jedem Widget neu parsen zu lassen. Tk benötigt dafür ein Root-Fenster, daher erst beim ersten Aufruf.
+FONTS = {}
+
+def get_font(size, weight="normal"):
+    key = (size, weight)
+    if key not in FONTS:
+        FONTS[key] = tkfont.Font(family="Arial", size=size, weight=weight)
+    return FONTS[key]
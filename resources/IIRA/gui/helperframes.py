@@ -1,25 +1,227 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import shutil
 import platform
 import os
-import webbrowser
+import threading
+
+from gui.fonts import get_font
 
 
 file_path = os.path.dirname(os.path.realpath(__file__))
-urls = ["https://irrcac.readthedocs.io/en/latest/irrCAC.html#module-irrCAC.weights",
+
+# Plattform wird einmalig bestimmt, statt bei jedem Mausrad-Event.
+PLATFORM = platform.system()
+if PLATFORM == "Linux":
+    WHEEL_EVENTS = ("<Button-4>", "<Button-5>")
+else:
+    WHEEL_EVENTS = ("<MouseWheel>",)
+
+URLS = ("https://irrcac.readthedocs.io/en/latest/irrCAC.html#module-irrCAC.weights",
         "https://journals.sagepub.com/doi/pdf/10.1177/001316446002000104",
         "https://psycnet.apa.org/record/1980-29309-001",
         "https://psycnet.apa.org/record/1972-05083-001",
         "https://www.narcis.nl/publication/RecordID/oai:repository.ubn.ru.nl:2066%2F54804",
         "https://bpspsychub.onlinelibrary.wiley.com/doi/abs/10.1348/000711006X126600",
         "https://agreestat.com/papers/wiley_encyclopedia2008_eoct631.pdf"
-        ]
+        )
+
+# Hilfetexte werden einmalig beim Import erzeugt. Abschnitte mit Tags sind als (Text, Tags, Text, Tags, ...)
+# abgelegt, sodass sie mit einem einzigen Text.insert eingefügt werden können.
+GENERAL_HELP = ("Das Hilfe-Symbol gibt dir auf jeder Seite Hinweise zu den Funktionalitäten der App.\n\n"
+                "Auf jeder Seite werden unterschiedliche Hilfsvorschläge angezeigt, je nachdem welche "
+                "Elemente gerade in der App angezeigt werden.\n\n"
+                "Die Navigation erfolgt über die Tabs. Jeder Tab beinhaltet nähere Informationen zu den "
+                "wichtigsten Elementen, die dir in der App begegnen werden.")
+
+ANALYSE_HELP = ("Die Analysieren-Funktion ermöglicht es dir Intra-, und\nInter-Rater-Reliability-"
+                "Untersuchungen durchzuführen.\n\n"
+                "Folgende Metriken können verwendet werden, um die\nReliability-Untersuchungen vorzunehmen:\n\n"
+                "• Cohen's \u03BA\n"
+                "• Conger's \u03BA\n"
+                "• Fleiss' \u03BA\n"
+                "• Krippendorff's \u03B1\n"
+                "• Gwet's AC\n"
+                "• ICC\n\n"
+                "Die für die Reliability-Untersuchungen benötigten Daten\nwerden im nächsten Schritt abgefragt.")
+
+RATE_HELP = ("Die Bewerten-Funktion ermöglicht es dir einen Datensatz zu importieren der "
+             "von dir, oder einem\nanderen SW-Nutzer, bewertet werden soll.\n\n"
+             "Dabei können die Daten mit beliebigen Labeln versehen werden (Kategorisierung).\n\n"
+             "Alternativ ist es möglich den Daten kontinuierliche Werte zuzuordnen, wie es "
+             "beispielsweise beim Messen von\nSehstärken der Fall wäre.")
+
+SCALE_HELP = (
+    ("Das Skalenformat beschreibt Eigenschaften der zu betrachtenden Daten. "
+     "Man kann zwischen den folgenden Skalenformaten\nuntescheiden:\n\n"), (),
+    "Nominalskala:\n ", "bold",
+    ("• Klassifikationen und Kategorisierungen\nsind möglich\n"
+     "• Objekte stehen nicht notwendigerweise\n"
+     "  in Relation zueinander\n"
+     "• z.B. {\"Rot\", \"Haus\", \"Stadt\"}\n\n"), (),
+    "Ordinalskala:\n", "bold",
+    ("• Es gibt zusätzlich eine Äquivalenzrelation\nx = y\n"
+     "• Und eine Ordnungsrelation x < y\n"
+     "• z.B. Schulnoten\n\n"), (),
+    "Intervallskala:\n", "bold",
+    ("• Abstände (Intervalle) sind definiert\n"
+     "• z.B. (01.01.22 -> 03.01.22)\n"
+     "        = (01.01.23 -> 03.01.23)\n"
+     "• Rechnen mit Intervallen ist erlaubt,\nmit Werten nicht\n\n"), (),
+    "Rationalskala:\n", "bold",
+    ("• Die Skala hat zusätzlich einen Nullpunkt\n"
+     "• Es darf mit den Werten multipliziert\n"
+     "  und dividiert werden.\n"
+     "• Dadurch könnn Verhältnisse gebildet werden.\n"
+     "• z.B. Programm A ist doppelt so schnell\n"
+     "  wie Programm B."))
+
+WEIGHTS_HELP = (
+    "Warum sind Gewichte erorderlich?\n\n", "bold",
+    ("Wenn man beispielsweise das ungewichtete "
+     "Cohen's \u03BA betrachtet und den Grad an "
+     "Übereinstimmung messen möchte, so würden "
+     "nur die Fälle als Übereinstimmung gewertet "
+     "werden, bei denen beide Räter die gleiche "
+     "Kategorie auswählen.\n\n"
+     "Gewichte ermöglich es darüber hinaus "
+     "Beziehungen zwischen den Kategorien "
+     "herzustellen. "
+     "So liegt es nahe, dass ein Rater der "
+     "einen Text als positiv bewertet mit "
+     "seiner Einschätzung mehr mit einem "
+     "Rater übereinstimmt, der den selben "
+     "Text als neutral bewertet, statt "
+     "mit einem Rater, der ihn als negativ "
+     "bewertet. "
+     "Wie stark diese Beziehungen ausgeprägt sind, "
+     "bzw. wie stark sie gewichtet werden sollen "
+     "hängt von der Wahl des Gewichts ab.\n\n"), (),
+    "Wie werden die Gewichte berechnet?\n\n", "bold",
+    "Ausführliche Informationen zur Berechnung der Gewichte gibt es auf ", (),
+    "dieser Website", ("link", "0"),
+    ".")
+
+# Beide Importformate unterscheiden sich nur in der Spalte, nach der die Daten organisiert sind.
+IMPORT_FORMAT_TEMPLATE = (
+    "Format {number}\n\n", "bold",
+    ("Beim {ordinal} Format sind die {plural} in einer eigenen Spalte organisiert.  "
+     "Es ist verpflichtend einem Header den Namen '{column}' zu geben, damit die {short_plural} "
+     "gefunden werden können. Auf Groß- und Kleinschreibung wird beim Header nicht geachtet. "
+     "Es ist aber darauf zu achten, dass der Headername nicht mehrfach vorkommt. "
+     "Es darf {same} {column} mehrfach in der Spalte vorkommen. Mehrfache Vorkommnisse "
+     "werden intern in dieser App zusammengefasst.\n\n\n"), (),
+    "Diskretes Skalenformat\n\n", "bold",
+    ("Falls du ein diskretes Skalenformaten (nominal, ordinal) ausgewählt hast, "
+     "muss die Datei zusätzlich eine Spalte mit dem Headernamen 'Categories' enthalten "
+     "Die Spalte enthält alle Kategorienamen, die bei der Analyse, oder beim Bewerten, vorkommen"
+     "können. Die Kategorienamen sind case sensitive.\n"
+     "Es spielt keine Rolle wo die '{column}'-, bzw. die 'Categories'-Spalten in der Datei auftauchen. "
+     "Die Suche nach den Spalten erfolgt alleine durch den Namen.\n\n\n"), (),
+    "Kontinuierliche Skalenformat\n\n", "bold",
+    ("Bei kontinuierlichen Skalenformaten (intervall, rational) gibt es keine 'Categories'-Spalte. "
+     "Vor der '{column}'-Spalte können beliebige Spalten auftauchen, die von IIRA ignoriert werden. "
+     "Es ist wichtig, dass nach der '{column}'-Spalte ausschließlich Spalten auftauchen, die die Bewertungen "
+     "enthalten. Bei kontinuierlichen Skalenformaten können diese Spalten nämlich nicht durch die Kategorienamen "
+     "automatisch gesucht werden."), ())
+
+def format_help_text(template, **values):
+    # Setzt die Werte in die Texte ein; die Tags an jeder zweiten Stelle bleiben unverändert.
+    return tuple(part.format(**values) if i % 2 == 0 else part for i, part in enumerate(template))
+
+# Die Texte werden einmalig beim Import erzeugt.
+IMPORT_FORMAT1_HELP = format_help_text(IMPORT_FORMAT_TEMPLATE, number=1, ordinal="ersten", plural="Rater ID's",
+                                       short_plural="ID's", column="Rater ID", same="die gleiche")
+IMPORT_FORMAT2_HELP = format_help_text(IMPORT_FORMAT_TEMPLATE, number=2, ordinal="zweiten", plural="Subjects",
+                                       short_plural="Subjects", column="Subject", same="das gleiche")
+
+RATER_HELP = (
+    "Auswahl der Bewerter\n\n\n", "bold",
+    ("Durch die Auswahl der Bewerter wird festgelegt, von welchen Bewertern die "
+     "Reliabilitätsuntersuchungen vorgenommen werden sollen.\n\n"
+     "Für jeden ausgewählten Intrarater wird eine eigene Intrarater-Reliabilitätsuntersuchung "
+     "für den Bewerter vorgenommen.\n\n"
+     "Bei der Auswahl mehrerer Interrater, wird eine Interrater-Reliabilitätsuntersuchung "
+     "für alle ausgewählten Bewerter erstellt."), ())
+
+METRICS_HELP = (
+    "Auswahl der Metriken\n\n", "bold",
+    ("Durch die Auswahl der Metriken kann festgelegt werden, welche Metrikwerte für die  "
+     "Reliabilitätsuntersuchungen berechnet werden sollen.\n\n"
+     "Weiterführende Informationen zu den Metriken, findest du unter den folgenden Links:\n\n"), (),
+    "Cohen's \u03BA\n", "bold",
+    "COHEN, Jacob. A coefficient of agreement for nominal scales. Educational and psychological measurement, 1960, 20. Jg., Nr. 1, S. 37-46.\n\n", ("link", "1"),
+    "Conger's \u03BA\n", "bold",
+    "Anthony J Conger. Integration and generalization of kappas for multiple raters. Psychological Bulletin, 88(2):322, 1980.\n\n", ("link", "2"),
+    "Fleiss' \u03BA\n", "bold",
+    "Joseph L Fleiss. Measuring nominal scale agreement among many raters. Psychological bulletin, 76(5):378, 1971.\n\n", ("link", "3"),
+    "Krippendorff's \u03B1\n", "bold",
+    "K. Krippendorff. Content Analysis: An Introduction To Its Methodology. Sage, Beverly Hills, CA, 1980.\n\n", ("link", "4"),
+    "Gwet's AC\n", "bold",
+    "GWET, Kilem Li. Computing inter‐rater reliability and its variance in the presence of high agreement. British Journal of Mathematical and Statistical Psychology, 2008, 61. Jg., Nr. 1, S. 29-48.\n\n", ("link", "5"),
+    "ICC\n", "bold",
+    "GWET, Kilem L. Intrarater reliability. Wiley encyclopedia of clinical trials, 2008, 4. Jg.\n\n", ("link", "6"))
+
+RESULTS_GENERAL_HELP = (
+    "Informationen zu den Ergebnissen\n\n", "bold",
+    ("Die Ergebnisse der Reliabilitätsuntersuchungen werden in zwei Tabs "
+     "dargestellt. In einem Tab werden die Ergebnisse der Intrarater-Analyse "
+     "dargestellt und im anderen Tab die Ergebnisse der Interrater-Analyse.\n"
+     "Vorausgesetzt, du hast im vorherigen Fenster die Auswahl getroffen, die entsprechenden "
+     "Analysen vorzunehmen.\n\n"), (),
+    "ID\n", "bold",
+    "Die Spalte gibt an auf welche Bewerter-ID sich die Analyse bezieht.\n\n", (),
+    "Metrikwerte\n", "bold",
+    "In den mittleren Spalten werden die Ergebnisse der Reliabilitätsuntersuchungen für jede ausgewählte Metrik angezeigt.\n\n", (),
+    "#Subjects\n", "bold",
+    ("Die Spalte gibt an, wie viele Subjects, oder Bewertungsobjekte, "
+     "es in der Reliabilitätsuntersuchung gibt."
+     "Falls ein Bewerter 10 unterschiedliche Subjects an zwei unterschiedlichen Beobachtungszeitpunkten "
+     "bewertet hat, würde in der Spalte also eine 10 stehen.\n\n"), (),
+    "#Replicates\n", "bold",
+    ("Die Spalte gibt an, wie viele Replikate es gibt. "
+     "Beim oberen Beispiel, in dem ein Bewerter 10 Subjects an zwei unterschiedlichen Beobachtungszeitpunkten "
+     "bewertet hat, würde in der Spalte also eine 2 stehen.\n\n"), (),
+    "#Rater\n", "bold",
+    ("Bei der Interrater-Analyse wird zusätzlich in einer Spalte angegeben, wie viele Bewerter "
+     "in der Analyse betrachtet worden sind."), ())
+
+INTERPRETATION_HELP = (
+    "Wie werden die Werte interpretiert?\n\n", "bold",
+    ("In der folgenden Tabelle wurde die gängige Interpretation der Ergebnisse der "
+     "Intra- und Interrater-Analysen dargestellt. Die Interpretationsmöglichkeit gilt "
+     "für alle auswählbaren Metriken.\n\n"), (),
+    "Interpretation nach Landis & Koch:\n\n", "bold",
+    "Metrikwert | Grad der Übereinstimmung\n", "bold",
+    "<0.00         | Poor\n", (),
+    "0.00 - 0.20 | Slight\n", (),
+    "0.21 - 0.40 | Fair\n", (),
+    "0.41 - 0.60 | Moderate\n", (),
+    "0.61 - 0.80 | Substantial\n", (),
+    "0.81 - 1.00 | Almost Perfect\n", ())
+
+RATE_GENERAL_HELP = (
+    "Informationen zum Bewerten\n\n", "bold",
+    ("In dieser Ansicht können die zuvor importierten Daten bewertet werden.\n\n"
+     "Es ist möglich über den Profil-Button das aktuelle Nutzerprofil zu wechseln. "
+     "Die Bewertungen werden immer dem Profil zugeordnet, das gerade angemeldet ist. "
+     "So ist es möglich während einer Bewertungssession mit unterschiedlichen Profilen Bewertungen vorzunehmen.\n\n"), (),
+    "Navigation\n", "bold",
+    ("Das Navigations-Widget links ermöglicht es schnell zwischen den Fragen hin und her zu springen. "
+     "Außerdem bietet es, neben der Statusbar oben, eine Übersicht darüber, wie viele Elemente bereits bewertet worden sind.\n"
+     "Zusätzlich sind die linke, bzw. die rechte, Pfeiltaste mit Hotkeys belegt, um zum vorherigen, bzw. zum nächsten, Element zu wechseln.\n\n"), (),
+    "Bewerten\n", "bold",
+    ("Um eine Bewertung vorzunehmen, kannst du die Radiobuttons ganz links drücken."
+     "Die ersten 9 Kategorien sind zusätzlich mit den Hotkeys 1-9 belegt.\n"
+     "Bei kontinuierlichen Daten kann das Eingabefeld ganz links zum Bewerten genutzt werden.\n\n"), (),
+    "Speichern & Verwerfen\n", "bold",
+    "Zum Speichern, oder zum Verwerfen der aktuellen Bewertungssession sind die jeweiligen Buttons oben rechts zu drücken.\n\n", ())
+
 
 class ProfileFrame(tk.Toplevel):
     def __init__(self, container):
         super().__init__(container)
         self.container = container
+        self.dbinteraction = container.dbinteraction
 
         self.user_input = tk.StringVar(value="")
 
@@ -29,9 +231,9 @@ class ProfileFrame(tk.Toplevel):
 
         container_frame = ttk.Frame(self)
 
-        signed_in_as_label = ttk.Label(container_frame, text="Angemeldet als", font="Arial 18")
-        self.profile_name_label = ttk.Label(container_frame, text=self.container.dbinteraction.active_profile,
-                                        font="Arial 18", image=self.container.face_icon, compound="left")
+        signed_in_as_label = ttk.Label(container_frame, text="Angemeldet als", font=get_font(18))
+        self.profile_name_label = ttk.Label(container_frame, text=self.dbinteraction.active_profile,
+                                        font=get_font(18), image=self.container.face_icon, compound="left")
 
         self.separator_frame = ttk.Frame(container_frame)
         create_delete_container = ttk.Frame(container_frame)
@@ -42,12 +244,13 @@ class ProfileFrame(tk.Toplevel):
         ok_button = ttk.Button(button_container, text="Ok", style="Accent.TButton", command=self.ok_cmd)
 
         self.change_profile_mbutton = ttk.Menubutton(button_container, text="Profil wechseln")
-        change_profile_menu = tk.Menu(self.change_profile_mbutton, tearoff=False)
-        self.change_profile_mbutton.configure(menu=change_profile_menu)
-        profile_selection = tk.StringVar()
-        for user in self.container.dbinteraction.profiles:
-            change_profile_menu.add_radiobutton(variable=profile_selection, value=user,
-                                                label=user, command=lambda: self.change_profile(profile_selection.get()))
+        # Das Menü wird nur einmal erzeugt und erst beim Öffnen befüllt, falls sich die Profile geändert haben.
+        self.change_profile_menu = tk.Menu(self.change_profile_mbutton, tearoff=False,
+                                           postcommand=self.on_menu_post)
+        self.change_profile_mbutton.configure(menu=self.change_profile_menu)
+        self.profile_selection = tk.StringVar()     # Wird von allen Einträgen geteilt und nicht neu erzeugt.
+        self.menu_dirty = True
+        self.menu_entries = []                      # Aktuell im Menü stehende Profile, in Menü-Reihenfolge.
 
         container_frame.pack(fill="both", expand=True)
         signed_in_as_label.grid(row=0, column=0, padx=15, pady=15)
@@ -74,31 +277,46 @@ class ProfileFrame(tk.Toplevel):
             self.destroy()
         else:
             # User-Input wurde gesetzt. Neues Profil wird angelegt.
-            self.container.dbinteraction.create_profile(self.user_input.get()) # Das neu angelegt Profil wechseln.
+            self.dbinteraction.create_profile(self.user_input.get()) # Das neu angelegt Profil wechseln.
             self.populate_profile_label()
-            self.populate_change_profile_menu()
+            self.menu_dirty = True
             self.user_input.set("")
 
-            for widget in self.separator_frame.winfo_children():
-                # Label und Input-Feld wieder aus der GUI entfernen.
-                widget.destroy()
+            # Label und Input-Feld wieder aus der GUI entfernen, indem der Container ersetzt wird.
+            parent = self.separator_frame.master
+            self.separator_frame.destroy()
+            self.separator_frame = ttk.Frame(parent)
+            self.separator_frame.grid(row=2, column=0, columnspan=2)
 
     def populate_profile_label(self):
-        self.profile_name_label.configure(text=self.container.dbinteraction.active_profile)
+        self.profile_name_label.configure(text=self.dbinteraction.active_profile)
+
+    def on_menu_post(self):
+        if self.menu_dirty:
+            self.populate_change_profile_menu()
+            self.menu_dirty = False
 
     def populate_change_profile_menu(self):
-        change_profile_menu = tk.Menu(self.change_profile_mbutton, tearoff=False)
-        self.change_profile_mbutton.configure(menu=change_profile_menu)
-        profile_selection = tk.StringVar()
-        for user in self.container.dbinteraction.profiles:
-            # Menü mit den gespeicherten Profilen füllen.
-            change_profile_menu.add_radiobutton(variable=profile_selection, value=user,
-                                                label=user, command=lambda:self.change_profile(profile_selection.get()))
+        # Vorhandene Einträge werden wiederverwendet; nur geänderte Einträge werden angepasst
+        # und nur die Differenz wird angehängt bzw. gelöscht.
+        old = self.menu_entries
+        new = list(self.dbinteraction.profiles)
+        for i, user in enumerate(new):
+            if i < len(old):
+                if old[i] != user:
+                    self.change_profile_menu.entryconfigure(i, label=user, value=user,
+                                                            command=lambda user=user: self.change_profile(user))
+            else:
+                self.change_profile_menu.add_radiobutton(variable=self.profile_selection, value=user,
+                                                         label=user, command=lambda user=user: self.change_profile(user))
+        if len(new) < len(old):
+            self.change_profile_menu.delete(len(new), "end")
+        self.menu_entries = new
 
     def create_new_profile(self):
         if not self.separator_frame.winfo_children():
             # Falls der Button noch nicht gedrückt wurde, füge Input-Feld hinzu.
-            name_label = ttk.Label(self.separator_frame, text="Name:", font="Arial 16")
+            name_label = ttk.Label(self.separator_frame, text="Name:", font=get_font(16))
             name_label.pack(side="left", padx=15)
 
             input = ttk.Entry(self.separator_frame, textvariable=self.user_input)
@@ -106,21 +324,23 @@ class ProfileFrame(tk.Toplevel):
             input.pack(side="right")
 
     def change_profile(self, profile_selection):
-        self.container.dbinteraction.change_profile(profile_selection)
+        self.dbinteraction.change_profile(profile_selection)
         self.populate_profile_label()
-        self.populate_change_profile_menu()
+        self.menu_dirty = True
 
     def delete_profile(self):
-        if len(self.container.dbinteraction.profiles) == 0:
+        if len(self.dbinteraction.profiles) == 0:
             # Kein anderes Profil vorhanden. Dann darf das Aktuelle nicht gelöscht werden.
             messagebox.showerror(title="Einziges Profil", message="Das ist dein einziges Profil. Erstelle erst ein Neues, um es zu löschen.")
         else:
-            self.container.dbinteraction.delete_profile()
+            self.dbinteraction.delete_profile()
             self.populate_profile_label()
-            self.populate_change_profile_menu()
+            self.menu_dirty = True
 
 
 class ScrollFrame(ttk.Frame):
+    wheelBound = False                                                              # wheel events are bound once for all scroll frames
+
     def __init__(self, parent):
         super().__init__(parent) # create a frame (self)
 
@@ -133,483 +353,262 @@ class ScrollFrame(ttk.Frame):
         self.canvas_window = self.canvas.create_window((4,4), window=self.viewPort, anchor="nw",            #add view port frame to canvas
                                   tags="self.viewPort")
 
+        self.frameConfigureId = None                                                # pending idle callback, coalesces bursts of <Configure> events
+        self.lastBbox = None                                                        # scroll region that is currently set on the canvas
+        self.lastWidth = -1                                                         # width that is currently set on the canvas window
         self.viewPort.bind("<Configure>", self.onFrameConfigure)                       #bind an event whenever the size of the viewPort frame changes.
         self.canvas.bind("<Configure>", self.onCanvasConfigure)                       #bind an event whenever the size of the canvas frame changes.
             
-        self.viewPort.bind("<Enter>", self.onEnter)                                 # bind wheel events when the cursor enters the control
-        self.viewPort.bind("<Leave>", self.onLeave)                                 # unbind wheel events when the cursorl leaves the control
+        if PLATFORM == "Windows":                                                   # scroll handler for the current platform
+            self.onMouseWheel = self.onMouseWheelWindows
+        elif PLATFORM == "Darwin":
+            self.onMouseWheel = self.onMouseWheelMac
+        else:
+            self.onMouseWheel = self.onMouseWheelX11
+
+        if not ScrollFrame.wheelBound:                                              # one persistent binding instead of bind_all/unbind_all on every enter/leave
+            for sequence in WHEEL_EVENTS:
+                self.bind_all(sequence, ScrollFrame.onGlobalMouseWheel, add="+")
+            ScrollFrame.wheelBound = True
 
-        self.onFrameConfigure(None)                                                 #perform an initial stretch on render, otherwise the scroll region has a tiny border until the first resize
+        self.updateScrollRegion()                                                   #perform an initial stretch on render, otherwise the scroll region has a tiny border until the first resize
 
     def onFrameConfigure(self, event):                                              
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))                 #whenever the size of the frame changes, alter the scroll region respectively.
+        if self.frameConfigureId is None:                                           # only one scroll region update per idle cycle, no matter how many events arrive
+            self.frameConfigureId = self.after_idle(self.updateScrollRegion)
+
+    def updateScrollRegion(self):
+        self.frameConfigureId = None
+        bbox = self.canvas.bbox("all")
+        if bbox != self.lastBbox:                                                   # skip the configure call if the content size did not change
+            self.canvas.configure(scrollregion=bbox)                                #whenever the size of the frame changes, alter the scroll region respectively.
+            self.lastBbox = bbox
+
+    def destroy(self):
+        if self.frameConfigureId is not None:                                       # drop a pending update, the canvas is about to be destroyed
+            self.after_cancel(self.frameConfigureId)
+            self.frameConfigureId = None
+        super().destroy()
 
     def onCanvasConfigure(self, event):
         canvas_width = event.width
+        if canvas_width == self.lastWidth:                                          # configure events without a width change need no round trip to Tcl
+            return
+        self.lastWidth = canvas_width
         self.canvas.itemconfig(self.canvas_window, width = canvas_width)            #whenever the size of the canvas changes alter the window region respectively.
 
-    def onMouseWheel(self, event):                                                  # cross platform scroll wheel event
-        if platform.system() == "Windows":
-            self.canvas.yview_scroll(int(-1* (event.delta/120)), "units")
-        elif platform.system() == "Darwin":
-            self.canvas.yview_scroll(int(-1 * event.delta), "units")
-        else:
-            if event.num == 4:
-                self.canvas.yview_scroll( -1, "units" )
-            elif event.num == 5:
-                self.canvas.yview_scroll( 1, "units" )
-    
-    def onEnter(self, event):                                                       # bind wheel events when the cursor enters the control
-        if platform.system() == "Linux":
-            self.canvas.bind_all("<Button-4>", self.onMouseWheel)
-            self.canvas.bind_all("<Button-5>", self.onMouseWheel)
-        else:
-            self.canvas.bind_all("<MouseWheel>", self.onMouseWheel)
-
-    def onLeave(self, event):                                                       # unbind wheel events when the cursorl leaves the control
-        if platform.system() == "Linux":
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
-        else:
-            self.canvas.unbind_all("<MouseWheel>")
-
-
-class MainHelpFrame(tk.Toplevel):
-    def __init__(self, container):
+    def onMouseWheelWindows(self, event):
+        self.canvas.yview_scroll(int(-1* (event.delta/120)), "units")
+
+    def onMouseWheelMac(self, event):
+        self.canvas.yview_scroll(int(-1 * event.delta), "units")
+
+    def onMouseWheelX11(self, event):
+        if event.num == 4:
+            self.canvas.yview_scroll( -1, "units" )
+        elif event.num == 5:
+            self.canvas.yview_scroll( 1, "units" )
+
+    @staticmethod
+    def onGlobalMouseWheel(event):                                                  # scroll the scroll frame below the cursor, if there is one
+        try:
+            widget = event.widget.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, AttributeError):                                          # widget unknown to tkinter (e.g. internal Tk widgets)
+            return
+        while widget is not None:
+            if isinstance(widget, ScrollFrame):
+                widget.onMouseWheel(event)
+                return
+            widget = widget.master
+
+
+class HelpFrame(tk.Toplevel):
+    # Basisklasse der Hilfefenster. Der Inhalt eines Tabs wird erst erzeugt, wenn der Tab zum ersten Mal angezeigt wird.
+    def __init__(self, container, title):
         super().__init__(container)
         self.container = container
 
-        self.title("Hilfe - Hauptmenü")
+        # Maße vom neuen Fenster
+        self.title(title)
         self.geometry("500x650")
 
         self.notebook = ttk.Notebook(self)
+        self.notebook.pack(expand = True, fill ="both")
 
-        tab_general = ttk.Frame(self.notebook)
-        tab_analyse = ttk.Frame(self.notebook)
-        tab_rate = ttk.Frame(self.notebook)
+        self.tab_builders = {}      # Tab-Name -> (Tab, Funktion, die den Inhalt erzeugt)
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
-        self.notebook.add(tab_general, text ="Generell")
-        self.notebook.add(tab_analyse, text ="Analysieren")
-        self.notebook.add(tab_rate, text ="Bewerten")
+        # Beim Schließen wird das Fenster nur versteckt, damit es beim nächsten Öffnen wiederverwendet werden kann.
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
 
-        self.notebook.pack(expand = True, fill ="both")
-
-        general_txt = tk.Text(tab_general, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        general_txt.insert("end", "Das Hilfe-Symbol gibt dir auf jeder Seite Hinweise zu den Funktionalitäten der App.\n\n")
-        general_txt.insert("end", ("Auf jeder Seite werden unterschiedliche Hilfsvorschläge angezeigt, je nachdem welche "
-                           "Elemente gerade in der App angezeigt werden.\n\n"))
-        general_txt.insert("end", ("Die Navigation erfolgt über die Tabs. Jeder Tab beinhaltet nähere Informationen zu den "
-                           "wichtigsten Elementen, die dir in der App begegnen werden."))
-        general_txt.pack(padx = 15, pady = 30)
-
-
-        analyse_txt = tk.Text(tab_analyse, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        analyse_txt.insert("end", ("Die Analysieren-Funktion ermöglicht es dir Intra-, und\nInter-Rater-Reliability-"
-                                   "Untersuchungen durchzuführen.\n\n"))
-        analyse_txt.insert("end", "Folgende Metriken können verwendet werden, um die\nReliability-Untersuchungen vorzunehmen:\n\n")
-        analyse_txt.insert("end", ("• Cohen's \u03BA\n"
-                                   "• Conger's \u03BA"
-                                   "• Fleiss' \u03BA\n"
-                                   "• Krippendorff's \u03B1\n"
-                                   "• Gwet's AC\n"
-                                   "• ICC\n\n"))
-        analyse_txt.insert("end", "Die für die Reliability-Untersuchungen benötigten Daten\nwerden im nächsten Schritt abgefragt.")
-        analyse_txt.pack(padx = 15, pady = 30)
-
-        rate_txt = tk.Text(tab_rate, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        rate_txt.insert("end", ("Die Bewerten-Funktion ermöglicht es dir einen Datensatz zu importieren der "
-                                "von dir, oder einem\nanderen SW-Nutzer, bewertet werden soll.\n\n"))
-        rate_txt.insert("end", "Dabei können die Daten mit beliebigen Labeln versehen werden (Kategorisierung).\n\n")
-        rate_txt.insert("end", ("Alternativ ist es möglich den Daten kontinuierliche Werte zuzuordnen, wie es "
-                                "beispielsweise beim Messen von\nSehstärken der Fall wäre."))
-        rate_txt.pack(padx = 15, pady = 30)
-
-
-class ScaleHelpFrame(tk.Toplevel):
-    def __init__(self, container):
-        super().__init__(container)
-        self.container = container
+    @classmethod
+    def show(cls, container):
+        # Pro Hilfefenster-Typ existiert nur eine Instanz, die am Container gespeichert wird.
+        help_frame = container.help_frames.get(cls)
+        if help_frame is None or not help_frame.winfo_exists():
+            # Beim ersten Aufruf, oder falls das Fenster doch zerstört wurde, neu erzeugen.
+            help_frame = cls(container)
+            container.help_frames[cls] = help_frame
+        else:
+            help_frame.deiconify()
+            help_frame.lift()
+        help_frame.focus_set()
+        return help_frame
 
-        # Maße vom neuen Fenster
-        self.title("Hilfe - Skalen & Gewichte")
-        self.geometry("500x650")
+    def add_tab(self, text, builder):
+        tab = ttk.Frame(self.notebook)
+        self.notebook.add(tab, text=text)
+        self.tab_builders[str(tab)] = (tab, builder)
 
-        self.notebook = ttk.Notebook(self)
+    def on_tab_changed(self, event=None):
+        tab_name = self.notebook.select()
+        if tab_name in self.tab_builders:
+            # Inhalt einmalig erzeugen; danach wird der Tab nur noch angezeigt.
+            tab, builder = self.tab_builders.pop(tab_name)
+            builder(tab)
 
-        tab_scale = ttk.Frame(self.notebook)
-        tab_weights = ttk.Frame(self.notebook)
 
-        self.notebook.add(tab_scale, text="Skalenformate")
-        self.notebook.add(tab_weights, text="Gewichte")
+class MainHelpFrame(HelpFrame):
+    def __init__(self, container):
+        super().__init__(container, "Hilfe - Hauptmenü")
 
-        self.notebook.pack(expand = True, fill ="both")
+        self.add_tab("Generell", self.build_general_tab)
+        self.add_tab("Analysieren", self.build_analyse_tab)
+        self.add_tab("Bewerten", self.build_rate_tab)
 
-        scale_txt = tk.Text(tab_scale, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        scale_txt.tag_configure("bold", font="Arial 18 bold")
-        
-        scale_txt.insert("end", ("Das Skalenformat beschreibt Eigenschaften der zu betrachtenden Daten. "
-                                 "Man kann zwischen den folgenden Skalenformaten\nuntescheiden:\n\n"))
-        scale_txt.insert("end", "Nominalskala:\n ", "bold")
-        scale_txt.insert("end", ("• Klassifikationen und Kategorisierungen\nsind möglich\n"
-                          "• Objekte stehen nicht notwendigerweise\n"
-                           "  in Relation zueinander\n"
-                           "• z.B. {\"Rot\", \"Haus\", \"Stadt\"}\n\n"))
-        scale_txt.insert("end", "Ordinalskala:\n", "bold")
-        scale_txt.insert("end", ("• Es gibt zusätzlich eine Äquivalenzrelation\nx = y\n"
-                          "• Und eine Ordnungsrelation x < y\n"
-                           "• z.B. Schulnoten\n\n"))
-        scale_txt.insert("end", "Intervallskala:\n", "bold")
-        scale_txt.insert("end", ("• Abstände (Intervalle) sind definiert\n"
-                                 "• z.B. (01.01.22 -> 03.01.22)\n" 
-                                 "        = (01.01.23 -> 03.01.23)\n"
-                                 "• Rechnen mit Intervallen ist erlaubt,\nmit Werten nicht\n\n"))
-        scale_txt.insert("end", "Rationalskala:\n", "bold")
-        scale_txt.insert("end", ("• Die Skala hat zusätzlich einen Nullpunkt\n"
-                                 "• Es darf mit den Werten multipliziert\n"
-                                 "  und dividiert werden.\n"
-                                 "• Dadurch könnn Verhältnisse gebildet werden.\n"
-                                 "• z.B. Programm A ist doppelt so schnell\n"
-                                 "  wie Programm B."))
-
-        scale_txt.pack(padx = 15, pady = 30)
-
-
-        weights_txt = ("Warum sind Gewichte erorderlich?\n\n"
-                       "Wenn man beispielsweise das ungewichtete "
-                       "Cohen's \u03BA betrachtet und den Grad an "
-                       "Übereinstimmung messen möchte, so würden "
-                       "nur die Fälle als Übereinstimmung gewertet "
-                       "werden, bei denen beide Räter die gleiche "
-                       "Kategorie auswählen.\n\n\n"
-                       "Gewichte ermöglich es darüber hinaus "
-                       "Beziehungen zwischen den Kategorien "
-                       "herzustellen.\n"
-                       "So liegt es nahe, dass ein Rater der "
-                       "einen Text als positiv bewertet mit "
-                       "seiner Einschätzung mehr mit einem "
-                       "Rater übereinstimmt, der den selben "
-                       "Text als neutral bewertet, statt "
-                       "mit einem Rater, der ihn als negativ "
-                       "bewertet.\n\n"
-                       )
-
-        weights_txt = tk.Text(tab_weights, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        weights_txt.tag_configure("bold", font="Arial 18 bold")
-        weights_txt.tag_configure("link", foreground="#217346", underline=True)     # Aussehen der Links festlegen
-        weights_txt.tag_configure("0")                                              # Für jeden Link separaten Tag, damit eine individuelle URL geöffnet werden kann.
-        weights_txt.tag_bind("0", "<Button-1>", lambda x: callback(urls[0]))
-
-        weights_txt.insert("end", "Warum sind Gewichte erorderlich?\n\n", "bold")
-        weights_txt.insert("end", ("Wenn man beispielsweise das ungewichtete "
-                                   "Cohen's \u03BA betrachtet und den Grad an "
-                                   "Übereinstimmung messen möchte, so würden "
-                                   "nur die Fälle als Übereinstimmung gewertet "
-                                   "werden, bei denen beide Räter die gleiche "
-                                   "Kategorie auswählen.\n\n"))
-        weights_txt.insert("end", ("Gewichte ermöglich es darüber hinaus "
-                                   "Beziehungen zwischen den Kategorien "
-                                   "herzustellen. "
-                                   "So liegt es nahe, dass ein Rater der "
-                                   "einen Text als positiv bewertet mit "
-                                   "seiner Einschätzung mehr mit einem "
-                                   "Rater übereinstimmt, der den selben "
-                                   "Text als neutral bewertet, statt "
-                                   "mit einem Rater, der ihn als negativ "
-                                   "bewertet. "
-                                   "Wie stark diese Beziehungen ausgeprägt sind, "
-                                   "bzw. wie stark sie gewichtet werden sollen "
-                                   "hängt von der Wahl des Gewichts ab.\n\n"))
-        weights_txt.insert("end", "Wie werden die Gewichte berechnet?\n\n", "bold")
+        self.on_tab_changed()       # Initial sichtbaren Tab befüllen.
 
-        img = tk.PhotoImage(file=os.path.join(file_path, "../data/img/weights_identity.png"))
-        weights_txt.insert("end", "Ausführliche Informationen zur Berechnung der Gewichte gibt es auf ")
-        weights_txt.insert("end", "dieser Website", ("link", "0"))
-        weights_txt.insert("end", ".")
+    def build_general_tab(self, tab_general):
+        # Reiner Fließtext ohne Tags oder Links; ein Label ist dafür deutlich leichter als ein Text-Widget.
+        general_label = ttk.Label(tab_general, text=GENERAL_HELP, foreground="black", background="white",
+                      font=get_font(18), wraplength=470, justify="left", anchor="nw")
+        general_label.pack(fill="both", expand=True, padx = 15, pady = 30)
 
+    def build_analyse_tab(self, tab_analyse):
+        analyse_label = ttk.Label(tab_analyse, text=ANALYSE_HELP, foreground="black", background="white",
+                      font=get_font(18), wraplength=470, justify="left", anchor="nw")
+        analyse_label.pack(fill="both", expand=True, padx = 15, pady = 30)
 
-        weights_txt.pack(padx=15, pady=30)
+    def build_rate_tab(self, tab_rate):
+        rate_label = ttk.Label(tab_rate, text=RATE_HELP, foreground="black", background="white",
+                      font=get_font(18), wraplength=470, justify="left", anchor="nw")
+        rate_label.pack(fill="both", expand=True, padx = 15, pady = 30)
 
 
-class ImportHelpFrame(tk.Toplevel):
+class ScaleHelpFrame(HelpFrame):
     def __init__(self, container):
-        super().__init__(container)
-        self.container = container
-
-        # Maße vom neuen Fenster
-        self.title("Hilfe - Importieren")
-        self.geometry("500x650")
+        super().__init__(container, "Hilfe - Skalen & Gewichte")
 
-        self.notebook = ttk.Notebook(self)
+        self.add_tab("Skalenformate", self.build_scale_tab)
+        self.add_tab("Gewichte", self.build_weights_tab)
 
-        tab_format1 = ttk.Frame(self.notebook)
-        tab_format2 = ttk.Frame(self.notebook)
+        self.on_tab_changed()       # Initial sichtbaren Tab befüllen.
 
-        self.notebook.add(tab_format1, text ="Format 1")
-        self.notebook.add(tab_format2, text ="Format 2")
+    def build_scale_tab(self, tab_scale):
+        make_help_text(tab_scale, SCALE_HELP, wrap="word")
 
-        self.notebook.pack(expand = True, fill ="both")
+    def build_weights_tab(self, tab_weights):
+        img = tk.PhotoImage(file=os.path.join(file_path, "../data/img/weights_identity.png"))
+        make_help_text(tab_weights, WEIGHTS_HELP, wrap="word")
 
-        format1_txt = tk.Text(tab_format1, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        format1_txt.tag_configure("bold", font="Arial 18 bold")
-        format1_txt.insert("end", "Format 1\n\n", "bold")
-        format1_txt.insert("end", ("Beim ersten Format sind die Rater ID's in einer eigenen Spalte organisiert.  "
-                                   "Es ist verpflichtend einem Header den Namen 'Rater ID' zu geben, damit die ID's "
-                                   "gefunden werden können. Auf Groß- und Kleinschreibung wird beim Header nicht geachtet. "
-                                   "Es ist aber darauf zu achten, dass der Headername nicht mehrfach vorkommt. "
-                                   "Es darf die gleiche Rater ID mehrfach in der Spalte vorkommen. Mehrfache Vorkommnisse "
-                                   "werden intern in dieser App zusammengefasst.\n\n\n"))
-        format1_txt.insert("end", "Diskretes Skalenformat\n\n", "bold")
-        format1_txt.insert("end", ("Falls du ein diskretes Skalenformaten (nominal, ordinal) ausgewählt hast, "
-                                   "muss die Datei zusätzlich eine Spalte mit dem Headernamen 'Categories' enthalten "
-                                   "Die Spalte enthält alle Kategorienamen, die bei der Analyse, oder beim Bewerten, vorkommen"
-                                   "können. Die Kategorienamen sind case sensitive.\n"
-                                   "Es spielt keine Rolle wo die 'Rater ID'-, bzw. die 'Categories'-Spalten in der Datei auftauchen. "
-                                   "Die Suche nach den Spalten erfolgt alleine durch den Namen.\n\n\n" 
-                                   ))
-        format1_txt.insert("end", "Kontinuierliche Skalenformat\n\n", "bold")
-        format1_txt.insert("end", ("Bei kontinuierlichen Skalenformaten (intervall, rational) gibt es keine 'Categories'-Spalte. "
-                                   "Vor der 'Rater ID'-Spalte können beliebige Spalten auftauchen, die von IIRA ignoriert werden. "
-                                   "Es ist wichtig, dass nach der 'Rater ID'-Spalte ausschließlich Spalten auftauchen, die die Bewertungen "
-                                   "enthalten. Bei kontinuierlichen Skalenformaten können diese Spalten nämlich nicht durch die Kategorienamen "
-                                   "automatisch gesucht werden."
-                                   ))
-        format1_txt.pack(padx = 15, pady = 30)
-
-        format2_txt = tk.Text(tab_format2, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        format2_txt.tag_configure("bold", font="Arial 18 bold")
-        format2_txt.insert("end", "Format 2\n\n", "bold")
-        format2_txt.insert("end", ("Beim zweiten Format sind die Subjects in einer eigenen Spalte organisiert.  "
-                                   "Es ist verpflichtend einem Header den Namen 'Subject' zu geben, damit die Subjects "
-                                   "gefunden werden können. Auf Groß- und Kleinschreibung wird beim Header nicht geachtet. "
-                                   "Es ist aber darauf zu achten, dass der Headername nicht mehrfach vorkommt. "
-                                   "Es darf das gleiche Subject mehrfach in der Spalte vorkommen. Mehrfache Vorkommnisse "
-                                   "werden intern in dieser App zusammengefasst.\n\n\n"))
-        format2_txt.insert("end", "Diskretes Skalenformat\n\n", "bold")
-        format2_txt.insert("end", ("Falls du ein diskretes Skalenformaten (nominal, ordinal) ausgewählt hast, "
-                                   "muss die Datei zusätzlich eine Spalte mit dem Headernamen 'Categories' enthalten "
-                                   "Die Spalte enthält alle Kategorienamen, die bei der Analyse, oder beim Bewerten, vorkommen"
-                                   "können. Die Kategorienamen sind case sensitive.\n"
-                                   "Es spielt keine Rolle wo die 'Subject'-, bzw. die 'Categories'-Spalten in der Datei auftauchen. "
-                                   "Die Suche nach den Spalten erfolgt alleine durch den Namen.\n\n\n" 
-                                   ))
-        format2_txt.insert("end", "Kontinuierliche Skalenformat\n\n", "bold")
-        format2_txt.insert("end", ("Bei kontinuierlichen Skalenformaten (intervall, rational) gibt es keine 'Categories'-Spalte. "
-                                   "Vor der 'Subject'-Spalte können beliebige Spalten auftauchen, die von IIRA ignoriert werden. "
-                                   "Es ist wichtig, dass nach der 'Subject'-Spalte ausschließlich Spalten auftauchen, die die Bewertungen "
-                                   "enthalten. Bei kontinuierlichen Skalenformaten können diese Spalten nämlich nicht durch die Kategorienamen "
-                                   "automatisch gesucht werden."))
-        format2_txt.pack(padx = 15, pady = 30)
-
-class PrepAnalyseHelpFrame(tk.Toplevel):
 
+class ImportHelpFrame(HelpFrame):
     def __init__(self, container):
-        super().__init__(container)
-        self.container = container
+        super().__init__(container, "Hilfe - Importieren")
 
-        # Maße vom neuen Fenster
-        self.title("Hilfe - Analyse vorbereiten")
-        self.geometry("500x650")
+        self.add_tab("Format 1", lambda tab: self.build_format_tab(tab, IMPORT_FORMAT1_HELP))
+        self.add_tab("Format 2", lambda tab: self.build_format_tab(tab, IMPORT_FORMAT2_HELP))
 
-        # Notebooks kann mit Textinhalt gefüllt werden und Inhalt
-        # wird über verschiedene Tabs organisiert.
-        self.notebook = ttk.Notebook(self)
+        self.on_tab_changed()       # Initial sichtbaren Tab befüllen.
+
+    def build_format_tab(self, tab_format, help_text):
+        make_help_text(tab_format, help_text)
+
+class PrepAnalyseHelpFrame(HelpFrame):
+
+    def __init__(self, container):
+        super().__init__(container, "Hilfe - Analyse vorbereiten")
 
         #TODO Namen anpassen
-        tab_rater = ttk.Frame(self.notebook)
-        tab_metrics = ttk.Frame(self.notebook)
+        self.add_tab("Bewerter", self.build_rater_tab)
+        self.add_tab("Metriken", self.build_metrics_tab)
 
-        self.notebook.add(tab_rater, text ="Bewerter")
-        self.notebook.add(tab_metrics, text ="Metriken")
+        self.on_tab_changed()       # Initial sichtbaren Tab befüllen.
 
-        self.notebook.pack(expand = True, fill ="both")
+    def build_rater_tab(self, tab_rater):
+        make_help_text(tab_rater, RATER_HELP)
 
-        rater_txt = tk.Text(tab_rater, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        rater_txt.tag_configure("bold", font="Arial 18 bold")
-        rater_txt.insert("end", "Auswahl der Bewerter\n\n\n", "bold")
-        rater_txt.insert("end", ("Durch die Auswahl der Bewerter wird festgelegt, von welchen Bewertern die "
-                                 "Reliabilitätsuntersuchungen vorgenommen werden sollen.\n\n"
-                                 "Für jeden ausgewählten Intrarater wird eine eigene Intrarater-Reliabilitätsuntersuchung "
-                                 "für den Bewerter vorgenommen.\n\n"
-                                 "Bei der Auswahl mehrerer Interrater, wird eine Interrater-Reliabilitätsuntersuchung "
-                                 "für alle ausgewählten Bewerter erstellt."))
-        rater_txt.pack(padx = 15, pady = 30)
-
-        metrics_txt = tk.Text(tab_metrics, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        metrics_txt.tag_configure("bold", font="Arial 18 bold")
-        metrics_txt.tag_configure("link", foreground="#217346", underline=True)     # Aussehen der Links festlegen
-        metrics_txt.tag_configure("1")                                              # Für jeden Link separaten Tag, damit eine individuelle URL geöffnet werden kann.
-        metrics_txt.tag_bind("1", "<Button-1>", lambda x: callback(urls[1]))
-        metrics_txt.tag_bind("2", "<Button-1>", lambda x: callback(urls[2]))
-        metrics_txt.tag_bind("3", "<Button-1>", lambda x: callback(urls[3]))
-        metrics_txt.tag_bind("4", "<Button-1>", lambda x: callback(urls[4]))
-        metrics_txt.tag_bind("5", "<Button-1>", lambda x: callback(urls[5]))
-        metrics_txt.tag_bind("6", "<Button-1>", lambda x: callback(urls[6]))
-
-        metrics_txt.insert("end", "Auswahl der Metriken\n\n", "bold")
-        metrics_txt.insert("end", ("Durch die Auswahl der Metriken kann festgelegt werden, welche Metrikwerte für die  "
-                                 "Reliabilitätsuntersuchungen berechnet werden sollen.\n\n"
-                                 "Weiterführende Informationen zu den Metriken, findest du unter den folgenden Links:\n\n"))
-        
-        metrics_txt.insert("end", "Cohen's \u03BA\n", "bold")
-        metrics_txt.insert("end", "COHEN, Jacob. A coefficient of agreement for nominal scales. Educational and psychological measurement, 1960, 20. Jg., Nr. 1, S. 37-46.\n\n", ("link", "1"))
-
-        metrics_txt.insert("end", "Conger's \u03BA\n", "bold")
-        metrics_txt.insert("end", "Anthony J Conger. Integration and generalization of kappas for multiple raters. Psychological Bulletin, 88(2):322, 1980.\n\n", ("link", "2"))
-
-        metrics_txt.insert("end", "Fleiss' \u03BA\n", "bold")
-        metrics_txt.insert("end", "Joseph L Fleiss. Measuring nominal scale agreement among many raters. Psychological bulletin, 76(5):378, 1971.\n\n", ("link", "3"))
-
-        metrics_txt.insert("end", "Krippendorff's \u03B1\n", "bold")
-        metrics_txt.insert("end", "K. Krippendorff. Content Analysis: An Introduction To Its Methodology. Sage, Beverly Hills, CA, 1980.\n\n", ("link", "4"))
-
-        metrics_txt.insert("end", "Gwet's AC\n", "bold")
-        metrics_txt.insert("end", "GWET, Kilem Li. Computing inter‐rater reliability and its variance in the presence of high agreement. British Journal of Mathematical and Statistical Psychology, 2008, 61. Jg., Nr. 1, S. 29-48.\n\n", ("link", "5"))
-
-        metrics_txt.insert("end", "ICC\n", "bold")
-        metrics_txt.insert("end", "GWET, Kilem L. Intrarater reliability. Wiley encyclopedia of clinical trials, 2008, 4. Jg.\n\n", ("link", "6"))
-
-        metrics_txt.pack(padx = 15, pady = 30)
-
-class ResultsHelpFrame(tk.Toplevel):
+    def build_metrics_tab(self, tab_metrics):
+        make_help_text(tab_metrics, METRICS_HELP)
+
+class ResultsHelpFrame(HelpFrame):
     """
     Die Klasse stellt dem SW-User ein Hilsdialog zur Verfügung, in Abhängigkeit
     von dem Frame in dem sich der SW-User aktuell befindet.
     TODO
     """
     def __init__(self, container):
-        super().__init__(container)
-        self.container = container
-
-        # Maße vom neuen Fenster
-        self.title("Hilfe - Ergebnisse")
-        self.geometry("500x650")
-
-        # Notebooks kann mit Textinhalt gefüllt werden und Inhalt
-        # wird über verschiedene Tabs organisiert.
-        self.notebook = ttk.Notebook(self)
+        super().__init__(container, "Hilfe - Ergebnisse")
 
         #TODO Namen anpassen
-        tab_general = ttk.Frame(self.notebook)
-        tab_interpratation = ttk.Frame(self.notebook)
+        self.add_tab("Generell", self.build_general_tab)
+        self.add_tab("Interpretation", self.build_interpretation_tab)
 
-        self.notebook.add(tab_general, text ="Generell")
-        self.notebook.add(tab_interpratation, text ="Interpretation")
+        self.on_tab_changed()       # Initial sichtbaren Tab befüllen.
 
-        self.notebook.pack(expand = True, fill ="both")
+    def build_general_tab(self, tab_general):
+        make_help_text(tab_general, RESULTS_GENERAL_HELP)
 
-        general_txt = tk.Text(tab_general, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        general_txt.tag_configure("bold", font="Arial 18 bold")
-        general_txt.insert("end", "Informationen zu den Ergebnissen\n\n", "bold")
-        general_txt.insert("end", ("Die Ergebnisse der Reliabilitätsuntersuchungen werden in zwei Tabs "
-                                   "dargestellt. In einem Tab werden die Ergebnisse der Intrarater-Analyse "
-                                   "dargestellt und im anderen Tab die Ergebnisse der Interrater-Analyse.\n"
-                                   "Vorausgesetzt, du hast im vorherigen Fenster die Auswahl getroffen, die entsprechenden "
-                                   "Analysen vorzunehmen.\n\n"))
-        
-        general_txt.insert("end", "ID\n", "bold")
-        general_txt.insert("end", "Die Spalte gibt an auf welche Bewerter-ID sich die Analyse bezieht.\n\n")
-
-        general_txt.insert("end", "Metrikwerte\n", "bold")
-        general_txt.insert("end", "In den mittleren Spalten werden die Ergebnisse der Reliabilitätsuntersuchungen für jede ausgewählte Metrik angezeigt.\n\n")
-
-        general_txt.insert("end", "#Subjects\n", "bold")
-        general_txt.insert("end", ("Die Spalte gibt an, wie viele Subjects, oder Bewertungsobjekte, "
-                                   "es in der Reliabilitätsuntersuchung gibt."
-                                   "Falls ein Bewerter 10 unterschiedliche Subjects an zwei unterschiedlichen Beobachtungszeitpunkten " 
-                                   "bewertet hat, würde in der Spalte also eine 10 stehen.\n\n"))
-
-        general_txt.insert("end", "#Replicates\n", "bold")
-        general_txt.insert("end", ("Die Spalte gibt an, wie viele Replikate es gibt. "
-                                   "Beim oberen Beispiel, in dem ein Bewerter 10 Subjects an zwei unterschiedlichen Beobachtungszeitpunkten "
-                                   "bewertet hat, würde in der Spalte also eine 2 stehen.\n\n"))
-        
-        general_txt.insert("end", "#Rater\n", "bold")
-        general_txt.insert("end", ("Bei der Interrater-Analyse wird zusätzlich in einer Spalte angegeben, wie viele Bewerter "
-                                   "in der Analyse betrachtet worden sind."))
-        
-        general_txt.pack(padx = 15, pady = 30)
-
-
-        interpretation_txt = tk.Text(tab_interpratation, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        interpretation_txt.tag_configure("bold", font="Arial 18 bold")
-        interpretation_txt.insert("end", "Wie werden die Werte interpretiert?\n\n", "bold")
-        interpretation_txt.insert("end", ("In der folgenden Tabelle wurde die gängige Interpretation der Ergebnisse der "
-                                          "Intra- und Interrater-Analysen dargestellt. Die Interpretationsmöglichkeit gilt "
-                                          "für alle auswählbaren Metriken.\n\n"))
-
-        interpretation_txt.insert("end", "Interpretation nach Landis & Koch:\n\n", "bold")
-        interpretation_txt.insert("end", "Metrikwert | Grad der Übereinstimmung\n", "bold")
-        interpretation_txt.insert("end", "<0.00         | Poor\n")
-        interpretation_txt.insert("end", "0.00 - 0.20 | Slight\n")
-        interpretation_txt.insert("end", "0.21 - 0.40 | Fair\n")
-        interpretation_txt.insert("end", "0.41 - 0.60 | Moderate\n")
-        interpretation_txt.insert("end", "0.61 - 0.80 | Substantial\n")
-        interpretation_txt.insert("end", "0.81 - 1.00 | Almost Perfect\n")
-
-        
-        interpretation_txt.pack(padx = 15, pady = 30)
-
-class RateHelpFrame(tk.Toplevel):
+    def build_interpretation_tab(self, tab_interpretation):
+        make_help_text(tab_interpretation, INTERPRETATION_HELP)
+
+class RateHelpFrame(HelpFrame):
     """
     Die Klasse stellt dem SW-User ein Hilsdialog zur Verfügung, in Abhängigkeit
     von dem Frame in dem sich der SW-User aktuell befindet.
     TODO
     """
     def __init__(self, container):
-        super().__init__(container)
-        self.container = container
-
-        # Maße vom neuen Fenster
-        self.title("Hilfe - Bewerten")
-        self.geometry("500x650")
-
-        # Notebooks kann mit Textinhalt gefüllt werden und Inhalt
-        # wird über verschiedene Tabs organisiert.
-        self.notebook = ttk.Notebook(self)
+        super().__init__(container, "Hilfe - Bewerten")
 
         #TODO Namen anpassen
-        tab_general = ttk.Frame(self.notebook)
-
-        self.notebook.add(tab_general, text ="Generell")
-
-        self.notebook.pack(expand = True, fill ="both")
-
-        general_txt = tk.Text(tab_general, foreground="black", background="white", relief="flat",
-                      font="Arial 18", highlightthickness = 0, borderwidth=0)
-        general_txt.tag_configure("bold", font="Arial 18 bold")
-        general_txt.insert("end", "Informationen zum Bewerten\n\n", "bold")
-        general_txt.insert("end", ("In dieser Ansicht können die zuvor importierten Daten bewertet werden.\n\n"
-                                   "Es ist möglich über den Profil-Button das aktuelle Nutzerprofil zu wechseln. "
-                                   "Die Bewertungen werden immer dem Profil zugeordnet, das gerade angemeldet ist. "
-                                   "So ist es möglich während einer Bewertungssession mit unterschiedlichen Profilen Bewertungen vorzunehmen.\n\n"))
-        
-        general_txt.insert("end", "Navigation\n", "bold")
-        general_txt.insert("end", "Das Navigations-Widget links ermöglicht es schnell zwischen den Fragen hin und her zu springen. "
-                                  "Außerdem bietet es, neben der Statusbar oben, eine Übersicht darüber, wie viele Elemente bereits bewertet worden sind.\n"
-                                  "Zusätzlich sind die linke, bzw. die rechte, Pfeiltaste mit Hotkeys belegt, um zum vorherigen, bzw. zum nächsten, Element zu wechseln.\n\n")
-
-        general_txt.insert("end", "Bewerten\n", "bold")
-        general_txt.insert("end", ("Um eine Bewertung vorzunehmen, kannst du die Radiobuttons ganz links drücken."
-                                   "Die ersten 9 Kategorien sind zusätzlich mit den Hotkeys 1-9 belegt.\n"
-                                   "Bei kontinuierlichen Daten kann das Eingabefeld ganz links zum Bewerten genutzt werden.\n\n"))
-
-        general_txt.insert("end", "Speichern & Verwerfen\n", "bold")
-        general_txt.insert("end", "Zum Speichern, oder zum Verwerfen der aktuellen Bewertungssession sind die jeweiligen Buttons oben rechts zu drücken.\n\n")
-
-        
-        general_txt.pack(padx = 15, pady = 30)
+        self.add_tab("Generell", self.build_general_tab)
+
+        self.on_tab_changed()       # Initial sichtbaren Tab befüllen.
+
+    def build_general_tab(self, tab_general):
+        make_help_text(tab_general, RATE_GENERAL_HELP)
+
+def apply_help_style(text_widget):
+    # Gemeinsame Tags aller Hilfetexte. Links erhalten zusätzlich einen Tag mit dem Index ihrer URL in URLS,
+    # der beim Einfügen vergeben wird und nicht konfiguriert werden muss.
+    text_widget.tag_configure("bold", font=get_font(18, "bold"))
+    text_widget.tag_configure("link", foreground="#217346", underline=True)     # Aussehen der Links festlegen
+    text_widget.tag_bind("link", "<Button-1>", open_help_link)                  # Ein Handler für alle Links
+
+def open_help_link(event):
+    # Die URL wird über den Index-Tag an der Klickposition bestimmt.
+    for tag in event.widget.tag_names("@%d,%d" % (event.x, event.y)):
+        if tag.isdigit():
+            callback(URLS[int(tag)])
+            return
+
+def make_help_text(parent, help_text, **options):
+    # Erzeugt ein Text-Widget im einheitlichen Stil der Hilfefenster und füllt es mit einem einzigen insert-Aufruf.
+    # help_text hat das Format (Text, Tags, Text, Tags, ...), siehe SCALE_HELP.
+    text_widget = tk.Text(parent, foreground="black", background="white", relief="flat",
+                          font=get_font(18), highlightthickness=0, borderwidth=0, undo=False, **options)
+    apply_help_style(text_widget)
+    text_widget.insert("end", *help_text)
+    # Statischer Inhalt; nach dem Befüllen schreibgeschützt. Links funktionieren über tag_bind weiterhin.
+    text_widget.configure(state="disabled", takefocus=0, cursor="arrow")
+    text_widget.pack(padx=15, pady=30)
+    return text_widget
 
 def callback(url):
     """ Die Funktion erhält ein String-Argument, welches im Webbrowser geöffnet wird. """
-    webbrowser.open_new(url)
\ No newline at end of file
+    # webbrowser wird erst beim ersten Klick auf einen Link importiert.
+    import webbrowser
+
+    # Das Starten des Browsers kann dauern; im eigenen Thread blockiert es die GUI nicht.
+    threading.Thread(target=webbrowser.open_new_tab, args=(url,), daemon=True).start()
\ No newline at end of file
@@ -1,43 +1,46 @@
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import tkinter.font as font
+from tkinter import ttk, messagebox
+from functools import partial
 
 from gui.containerframe import ContainerFrame
-from gui.fileframes import FileFrame, ScaleFrame
+from gui.fonts import get_font
 from gui.helperframes import MainHelpFrame
-from core.fileinteraction import FileValidation
-
-import pandas as pd
 
 class MainFrame(ContainerFrame):
+    styles_configured = False   # Styles sind global und müssen nur einmal konfiguriert werden.
+
     def __init__(self, container):
         super().__init__(container)
 
-
-        container.style.configure("MainFrame.TButton", font="Arial 25", foreground="black")
+        if not MainFrame.styles_configured:
+            container.style.configure("MainFrame.TButton", font="Arial 25", foreground="black")
+            container.style.configure("Info.TLabel", font=get_font(20))
+            container.style.configure("Welcome.TLabel", font=get_font(18, "bold"))
+            MainFrame.styles_configured = True
 
         if container.dbinteraction.active_profile == "":
-            self.no_profile()
+            # Profil-Dialog erst im Leerlauf öffnen, damit das Hauptfenster zuerst gezeichnet wird.
+            self.after_idle(self.no_profile)
 
         center_container = ttk.Frame(self, style="Card", padding=(5, 6, 7, 8))
         left_frame = ttk.Frame(center_container)
         vert_separator = ttk.Separator(center_container, orient="vertical")
         right_frame = ttk.Frame(center_container)
 
-        general_info = ttk.Label(center_container, font="Arial 20",
+        general_info = ttk.Label(center_container, style="Info.TLabel",
                                 text="Importiere einen Datensatz und ...")
 
-        analyse_info = ttk.Label(left_frame, font="Arial 20",
+        analyse_info = ttk.Label(left_frame, style="Info.TLabel",
                                 text="... führe eine Intra-, bzw. Inter-Rater-Analyse durch:")
 
         analyse_buton = ttk.Button(left_frame, text="Analysieren", image=container.analyse_icon, compound="left",
-                                   style="MainFrame.TButton", command=lambda: self.start_mode("analyse"))
+                                   style="MainFrame.TButton", command=partial(self.start_mode, "analyse"))
 
-        rate_info = ttk.Label(right_frame, font="Arial 20",
+        rate_info = ttk.Label(right_frame, style="Info.TLabel",
                                 text="... bewerte den Text, um eine\nIntra-Rater-Reliability-Untersuchung zu erstellen:")
         rate_button = ttk.Button(right_frame, text="Bewerten", image=container.rate_icon, compound="left",
-                                 style="MainFrame.TButton", command=lambda: self.start_mode("rate"))
+                                 style="MainFrame.TButton", command=partial(self.start_mode, "rate"))
 
         self.menu_bar.grid(row=0, column=0, sticky="nsew")
         center_container.grid(row=1, column=0, sticky="nsew", padx=15, pady=15)
@@ -75,19 +78,21 @@ class MainFrame(ContainerFrame):
                 
         user_input = tk.StringVar(value="") # Beinhaltet Namen, falls ein neues Profil angelegt wird.
         profile_window = tk.Toplevel(self.container) # Neues Fenster
+        profile_window.withdraw()   # Erst anzeigen, wenn alle Widgets platziert sind.
         profile_window.title("Profil erstellen")
         profile_window.geometry("500x250")
         profile_window.resizable(False, False)
 
         container_frame = ttk.Frame(profile_window)
 
-        welcome_label = ttk.Label(container_frame, text="Willkommen!", font="Arial 18 bold")
-        profile_label = ttk.Label(container_frame, text="Es wurde noch kein Profil angelegt.\nWie möchtest du heißen?", font="Arial 16")
+        welcome_label = ttk.Label(container_frame, text="Willkommen!", style="Welcome.TLabel")
+        profile_label = ttk.Label(container_frame, text="Es wurde noch kein Profil angelegt.\nWie möchtest du heißen?", font=get_font(16))
 
         input_container = ttk.Frame(container_frame)
-        name_label = ttk.Label(input_container, text="Name:", font="Arial 16",
+        name_label = ttk.Label(input_container, text="Name:", font=get_font(16),
                                image=self.container.face_icon, compound="left")
-        input = ttk.Entry(input_container, textvariable=user_input)
+        name_entry = ttk.Entry(input_container, textvariable=user_input)
+        name_entry.bind("<Return>", lambda x: start_cmd())    # Profil auch mit der Enter-Taste anlegen
 
         start_button = ttk.Button(container_frame, text="Starten", command=start_cmd)
 
@@ -98,12 +103,15 @@ class MainFrame(ContainerFrame):
         input_container.grid(row=2, column=0, sticky="nsew", padx=15, pady=20)
 
         name_label.pack(side="left", padx=(60, 0))
-        input.pack(side="right", padx=(0, 60))
+        name_entry.pack(side="right", padx=(0, 60))
 
         start_button.grid(row=3, column=0, padx=15, pady=8)
 
         # Responsive Design
         container_frame.columnconfigure(0, weight=1)
 
+        profile_window.deiconify()
+        name_entry.focus_set()
+
     def help_cmd(self,event=None):
-        MainHelpFrame(self.container)
\ No newline at end of file
+        MainHelpFrame.show(self.container)
\ No newline at end of file
@@ -1,33 +1,81 @@
-import math
+import os
+import json
+import hashlib
+import textwrap
+from operator import itemgetter
+from functools import partial
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, filedialog, messagebox
 
 import pandas as pd
 import numpy as np
 
 from gui.containerframe import ContainerFrame
+from gui.fonts import get_font
+from gui.constants import FILE_TYPES
 from gui.helperframes import RateHelpFrame
 
 PROFILE = 0
 RATING = 1
 
+file_path = os.path.dirname(os.path.realpath(__file__))
+# Autosave im Benutzerverzeichnis, nicht im Programmordner. Pro Profil und Datei eine eigene JSON-Datei.
+AUTOSAVE_DIR = os.path.join(os.path.expanduser("~"), ".iira")
+AUTOSAVE_DELAY = 500    # ms; mehrere Bewertungen innerhalb dieser Zeit werden mit einem Schreibvorgang gesichert.
+
+# Farbe der Prozentanzeige in 20 %-Schritten: unter 20 % rot, unter 40 % orange, ... ab 80 % grün.
+PERCENT_STYLES = ("Red.TLabel", "Orange.TLabel", "Yellow.TLabel", "Lightgreen.TLabel", "Green.TLabel")
+
+def is_upper_heavy(text):
+    # Großbuchstaben sind breiter; bei überwiegend Großbuchstaben werden weniger Zeichen pro Zeile angezeigt.
+    return sum(map(str.isupper, text)) >= len(text) // 2
+
+def permute(items, permutation):
+    # Ordnet die Liste in C per itemgetter um, statt Element für Element in Python.
+    # Bei weniger als zwei Elementen gibt itemgetter kein Tupel zurück; dann gibt es auch nichts umzuordnen.
+    if len(permutation) < 2:
+        return list(items)
+    return list(itemgetter(*permutation)(items))
+
+def inverse_permutation(permutation):
+    # Inverse Permutation direkt in O(n) aufbauen statt per argsort in O(n log n).
+    inverse = np.empty_like(permutation)
+    inverse[permutation] = np.arange(len(permutation))
+    return inverse
+
 class RateFrame(ContainerFrame):
 
     def __init__(self, container):
         self.text = []
+        self.nav_labels = []    # Gekürzte Texte für die Navigation; gleiche Reihenfolge wie self.text.
+        self.upper_heavy = []   # Pro Text, ob er überwiegend aus Großbuchstaben besteht.
+        self.parent_labels = [] # Texte der Parent-Nodes in der Navigation, ohne Häckchen.
+        self.child_iids = []    # iids der Navigation nach Position; werden beim Mischen nicht umgeordnet.
+        self.parent_iids = []
+        self.parent_index = {}  # iid des Parent-Nodes -> Index, für die Treeview-Events
+        self.wrapped_text = []  # Umgebrochene Texte für das Text-Label; werden erst bei Bedarf berechnet.
         self.text_index = 0
         self.profile = container.dbinteraction.active_profile
+        self.is_numeric = False     # Intervall- oder Rationalskala; wird in update_frame gesetzt
+        self.category_layout = None # Skalenformat und Kategorien, für die die Kategorie-Widgets erzeugt wurden
 
         self.ratings = []
+        self.rated = np.zeros(0, dtype=bool)    # True, falls für das Element bereits ein Rating gesetzt ist
         self.total_ratings = 0  
+        self.bucket_remaining = np.zeros(0, dtype=np.int16)   # Anzahl noch nicht bewerteter Elemente pro Parent-Node
 
         self.shuffler = None
         self.undo_shuffler = None
+        self.autosave_id = None     # Geplanter Autosave, falls einer aussteht
+        self.autosave_path = None   # Sicherungskopie der aktuellen Session; wird in update_frame gesetzt
+        self.percentage_id = None   # Geplante Aktualisierung der Prozentanzeige, falls eine aussteht
+
+        self.open_parent = 0    # Index des Parent-Nodes in der Navigation, der zuletzt aufgeklappt wurde.
 
         super().__init__(container)
-        container.style.configure("RateFrame.Treeview", font="Arial 16 bold", rowheight=30)
-        container.style.configure("RateFrame.Treeview.Heading", font="Arial 18")
-        container.style.configure("RateFrame.TRadiobutton", font="Arial 16")
+        container.style.configure("RateFrame.Treeview", font=get_font(16, "bold"), rowheight=30)
+        container.style.configure("RateFrame.Treeview.Heading", font=get_font(18))
+        container.style.configure("RateFrame.TRadiobutton", font=get_font(16))
         container.style.configure("Red.TLabel", foreground="#CC0000")
         container.style.configure("Orange.TLabel", foreground="#FF8000")
         container.style.configure("Yellow.TLabel", foreground="#CCCC00")
@@ -50,25 +98,8 @@ class RateFrame(ContainerFrame):
         vert_separator = ttk.Separator(self.menu_bar, orient="vertical")
         vert_separator.grid(row=0, column=6, sticky="nsew")
 
-        save_frame = ttk.Frame(self.menu_bar, width=75, height=50)
-        save_label = ttk.Label(save_frame, text="Speichern", image=self.container.save_icon, compound="top", font="Arial 12")
-        save_frame.bind("<Enter>", lambda x: self.on_enter(save_frame, save_label))
-        save_frame.bind("<Leave>", lambda x: self.on_leave(save_frame, save_label))
-        save_frame.bind("<Button-1>", lambda x: self.save_cmd())
-        save_label.bind("<Button-1>", lambda x: self.save_cmd())
-
-        save_frame.grid(row=0, column=7, sticky="nsew")
-        save_label.place(relx=0.5, rely=0.5, anchor="center")
-
-        delete_frame = ttk.Frame(self.menu_bar, width=85, height=50)
-        delete_label = ttk.Label(delete_frame, text="Verwerfen", image=self.container.delete_icon, compound="top", font="Arial 12")
-        delete_frame.bind("<Enter>", lambda x: self.on_enter(delete_frame, delete_label))
-        delete_frame.bind("<Leave>", lambda x: self.on_leave(delete_frame, delete_label))
-        delete_frame.bind("<Button-1>", lambda x: self.delete_cmd())
-        delete_label.bind("<Button-1>", lambda x: self.delete_cmd())
-
-        delete_frame.grid(row=0, column=8, sticky="nsew")
-        delete_label.place(relx=0.5, rely=0.5, anchor="center")
+        self.create_menu_button(7, "Speichern", self.container.save_icon, self.save_cmd, 75)
+        self.create_menu_button(8, "Verwerfen", self.container.delete_icon, self.delete_cmd, 85)
 
         horizon_separator = ttk.Separator(self.menu_bar, orient="horizontal")
         horizon_separator.grid(row=1, column=6, columnspan=3, sticky="nsew")
@@ -86,17 +117,21 @@ class RateFrame(ContainerFrame):
                                         selectmode="browse")
         self.text_preview.heading("text", text="Navigation")
         self.text_preview.pack(fill="both", expand=True, pady=25, padx=5)
-        self.text_preview.tag_configure("unselected", font="Arial 14")
+        self.text_preview.tag_configure("unselected", font=get_font(14))
         self.text_preview.bind("<Double-Button-1>", self.doubleclick_treeview)
+        self.text_preview.bind("<<TreeviewOpen>>", self.on_treeview_open)
+        self.text_preview.bind("<<TreeviewClose>>", self.on_treeview_close)
         self.text_preview.bind("<Right>", self.next_cmd)
         self.text_preview.bind("<Left>", self.prev_cmd)
 
-        self.percent_label = ttk.Label(top_frame, text="0 %", font="Arial 20", style="Red.TLabel")
+        self.percent_text = "0 %"           # Aktuell angezeigter Text und Style der Prozentanzeige
+        self.percent_style = "Red.TLabel"
+        self.percent_label = ttk.Label(top_frame, text=self.percent_text, font=get_font(20), style=self.percent_style)
         self.percent_label.pack()
 
         top_frame.grid(row=2, column=1, sticky="nsew")
 
-        self.text_label = ttk.Label(mid_frame, text="", font="Arial 20")
+        self.text_label = ttk.Label(mid_frame, text="", font=get_font(20))
 
         mid_btn_container = ttk.Frame(mid_frame)
         prev_btn = ttk.Button(mid_btn_container, text="\u276E", command=self.prev_cmd)
@@ -127,47 +162,119 @@ class RateFrame(ContainerFrame):
 
         
 
+    def create_menu_button(self, column, text, icon, command, width):
+        # Erzeugt einen Button in der Menüleiste aus Frame und Label.
+        frame = ttk.Frame(self.menu_bar, width=width, height=50)
+        label = ttk.Label(frame, text=text, image=icon, compound="top", font=get_font(12))
+        frame.bind("<Enter>", partial(self.on_enter, frame, label))
+        frame.bind("<Leave>", partial(self.on_leave, frame, label))
+        frame.bind("<Button-1>", lambda x: command())
+        label.bind("<Button-1>", lambda x: command())
+
+        frame.grid(row=0, column=column, sticky="nsew")
+        label.place(relx=0.5, rely=0.5, anchor="center")
+
     def populate_navigation(self):
+        n_text = len(self.text)
+        # Beim letzten Parent-Node die maximale Anzahl an Text exakt als obere Grenze ausgeben
+        self.parent_labels = [f"Elemente {start + 1} - {min(start + 10, n_text)}"
+                              for start in range(0, n_text, 10)]
 
-        upper_limit = math.ceil(len(self.text) / 10)
-        for i in range(upper_limit): #aufrunden, damit es genügend parent nodes gibt
+        for i, (parent_iid, parent_label) in enumerate(zip(self.parent_iids, self.parent_labels)):
             # values arguments als tuple, um treeview internes nlp zu vermeiden
-            if i == upper_limit - 1:
-                # Beim letzten Schleifendurchlauf im Parent-Node die maximale Anzahl an Text
-                # exakt ausgeben als obere Grenze
-                self.text_preview.insert("", "end", iid=("parent_" + str(i)), open=False, 
-                                        values=(("Elemente " + str(i * 10 + 1) + " - " + str(len(self.text))),))
-            else:
-                self.text_preview.insert("", "end", iid=("parent_" + str(i)), open=False, 
-                                        values=(("Elemente " + str(i * 10 + 1) + " - " + str(i * 10 + 10)),))
-
-            # Populate the children:
-            for j in range(10):
-                k = j + 10 * i # Offset k; 0 <= k < len(self.text)
-                if k >= len(self.text):
-                    break
-                n = self.count_upper_case(self.text[k], 18)
-                nav_text = self.text[k]
-
-                if len(self.text[k]) > n:
-                    nav_text = self.text[k][:n] + "..."
-                self.text_preview.insert(("parent_" + str(i)), "end", iid=("child_" + str(k)), open=False,
-                                        values=(nav_text,), tags=("unselected"))
-        
-        self.text_preview.item("parent_0", open=True)
-        self.text_preview.focus("child_0")
-        self.text_preview.selection_set("child_0")
+            self.text_preview.insert("", "end", iid=parent_iid, open=False, values=(parent_label,))
+
+            # Die Child-Nodes werden erst beim Aufklappen erzeugt. Der Platzhalter sorgt dafür,
+            # dass der Parent-Node trotzdem aufklappbar ist.
+            self.text_preview.insert(parent_iid, "end", iid=f"placeholder_{i}")
+
+        self.populate_children(0)
+        self.text_preview.item(self.parent_iids[0], open=True)
+        self.open_parent = 0
+
+        self.text_preview.focus(self.child_iids[0])
+        self.text_preview.selection_set(self.child_iids[0])
+
+    def populate_children(self, i):
+        placeholder_iid = f"placeholder_{i}"
+        if not self.text_preview.exists(placeholder_iid):
+            # Die Child-Nodes wurden bereits erzeugt.
+            return
+
+        self.text_preview.delete(placeholder_iid)
+
+        insert = self.text_preview.insert
+        nav_labels = self.nav_labels
+        rated = self.rated
+        parent_iid = self.parent_iids[i]
+        child_iids = self.child_iids
+        for k in range(i * 10, min(i * 10 + 10, len(nav_labels))):
+            nav_text = nav_labels[k]
+
+            # Bereits bewertete Elemente direkt mit Häckchen anzeigen.
+            tags = ("unselected",)
+            if rated[k]:
+                tags += ("labeled",)
+                nav_text += " ✓"
+            insert(parent_iid, "end", iid=child_iids[k], open=False, values=(nav_text,), tags=tags)
+
+    def unload_children(self, i):
+        # Child-Nodes eines zugeklappten Parent-Nodes wieder durch den Platzhalter ersetzen.
+        parent_iid = self.parent_iids[i]
+        self.text_preview.delete(*self.text_preview.get_children(parent_iid))
+        self.text_preview.insert(parent_iid, "end", iid=f"placeholder_{i}")
+
+    def switch_open_parent(self, i):
+        # Nur die Child-Nodes eines Parent-Nodes bleiben erzeugt. Der zuvor geöffnete Parent-Node
+        # wird zugeklappt und wieder durch den Platzhalter ersetzt.
+        if i != self.open_parent:
+            self.text_preview.item(self.parent_iids[self.open_parent], open=False)
+            self.unload_children(self.open_parent)
+            self.open_parent = i
+        self.populate_children(i)
+
+    def on_treeview_open(self, event):
+        item_iid = self.text_preview.focus()
+        if item_iid in self.parent_index:
+            self.switch_open_parent(self.parent_index[item_iid])
+
+    def on_treeview_close(self, event):
+        item_iid = self.text_preview.focus()
+        if item_iid in self.parent_index:
+            self.unload_children(self.parent_index[item_iid])
+
+    def compute_nav_labels(self):
+        # Die gekürzten Navigationstexte werden einmal pro Text berechnet und beim Aufklappen nur noch gelesen.
+        # Die Großbuchstaben werden dabei einmal pro Text gezählt und für das Text-Label wiederverwendet.
+        self.upper_heavy = [is_upper_heavy(text) for text in self.text]
+        self.nav_labels = []
+        for i, text in enumerate(self.text):
+            n = self.line_width(i, 18)
+            self.nav_labels.append(text[:n] + "..." if len(text) > n else text)
 
     def randomize(self, mode):
         if mode == "do":
             self.shuffler = np.random.permutation(len(self.text))
-            self.undo_shuffler = np.argsort(self.shuffler)
+            self.undo_shuffler = inverse_permutation(self.shuffler)
+            order = self.shuffler
+        elif mode == "undo":
+            order = self.undo_shuffler
+        else:
+            return
 
-            self.text = [self.text[j] for j in self.shuffler]
-            self.ratings = [self.ratings[j] for j in self.shuffler]
-        if mode == "undo":
-            self.text = [self.text[j] for j in self.undo_shuffler]
-            self.ratings = [self.ratings[j] for j in self.undo_shuffler]
+        # Texte und alle pro Text zwischengespeicherten Werte gemeinsam umordnen,
+        # damit die Caches gültig bleiben und nicht neu berechnet werden müssen.
+        permutation = order.tolist()
+        self.text = permute(self.text, permutation)
+        self.ratings = permute(self.ratings, permutation)
+        self.nav_labels = permute(self.nav_labels, permutation)
+        self.wrapped_text = permute(self.wrapped_text, permutation)
+        self.upper_heavy = permute(self.upper_heavy, permutation)
+        self.rated = self.rated[order]
+
+        # Zähler pro Parent-Node passend zur neuen Reihenfolge neu berechnen.
+        self.bucket_remaining = np.bincount(np.flatnonzero(~self.rated) // 10,
+                                            minlength=len(self.bucket_remaining)).astype(np.int16)
 
 
     def doubleclick_treeview(self, event):
@@ -176,85 +283,72 @@ class RateFrame(ContainerFrame):
         if "child_" in item_iid:
             self.text_index = int(item_iid.replace("child_", ""))       # Zum ausgewählten Element springen
             self.populate_text()
-
-
-            if self.ratings[self.text_index] != (): 
-                self.categories_var.set(self.ratings[self.text_index][RATING])
-            else:
-                self.categories_var.set("")
+            self.sync_rating_widgets()
+            self.focus_child(self.text_index)
         
         self.focus_set()
 
 
     def delete_questions(self):
-        for item in self.text_preview.get_children():
-            self.text_preview.delete(item)
+        self.text_preview.delete(*self.text_preview.get_children())
 
     def populate_categories(self):
-        if self.container.scale_format == "intervall" or self.container.scale_format == "ratio":
-            info_label = ttk.Label(self.rbtn_container, text="Eingegeben:", font="Arial 16")
-            self.var_entered = ttk.Label(self.rbtn_container, text="n.a.", font="Arial 16")
+        if self.is_numeric:
+            info_label = ttk.Label(self.rbtn_container, text="Eingegeben:", font=get_font(16))
+            self.var_entered = ttk.Label(self.rbtn_container, text="n.a.", font=get_font(16))
             self.var_input = ttk.Entry(self.rbtn_container, textvariable=self.categories_var, text="Zahlenwert eingeben",
-                                  font="Arial 16")
+                                  font=get_font(16))
             self.var_input.bind("<Return>", self.entry_input_cmd)
 
             info_label.pack(pady=5)
             self.var_entered.pack(pady=5)
             self.var_input.pack(pady=15)
         else:
-            categories_rbtns = []
-            for i in range(len(self.container.categories)):
-                categories_rbtns.append(
-                    ttk.Radiobutton(self.rbtn_container, text=self.container.categories[i],
-                    variable=self.categories_var, value=self.container.categories[i],
-                    style="RateFrame.TRadiobutton", command=self.label_text)
-                    )
-                categories_rbtns[i].pack(side="top", anchor="nw", pady=5)
-                if i < 9:
-                    if self.container.scale_format == "nominal" or self.container.scale_format == "ordinal":
-                        self.bind_all(str(i + 1), self.cat_hotkey_cmd)
+            # Erst alle Radiobuttons erzeugen, dann in einem Durchlauf platzieren.
+            categories_rbtns = [ttk.Radiobutton(self.rbtn_container, text=category,
+                                                variable=self.categories_var, value=category,
+                                                style="RateFrame.TRadiobutton", command=self.label_text)
+                                for category in self.container.categories]
+            for rbtn in categories_rbtns:
+                rbtn.pack(side="top", anchor="nw", pady=5)
+
+            # Die ersten 9 Kategorien erhalten die Hotkeys 1-9. bind_all gilt über die Session hinaus,
+            # daher wird die Kategorie erst beim Tastendruck nachgeschlagen.
+            if self.container.scale_format == "nominal" or self.container.scale_format == "ordinal":
+                for i in range(min(len(self.container.categories), 9)):
+                    self.bind_all(str(i + 1), partial(self.category_hotkey_cmd, i))
 
     def delete_categories(self):
-        children_widgets = self.rbtn_container.winfo_children()
-        for widget in children_widgets:
-            widget.destroy()
+        # Container als Ganzes ersetzen, statt jedes Widget einzeln zu löschen.
+        parent = self.rbtn_container.master
+        self.rbtn_container.destroy()
+        self.rbtn_container = ttk.Frame(parent)
+        self.rbtn_container.grid(row=2, column=0)
 
     def populate_text(self):
-        self.text_label.config(text=self.add_newlines(self.text[self.text_index], 75))
+        wrapped = self.wrapped_text[self.text_index]
+        if wrapped is None:
+            wrapped = self.wrapped_text[self.text_index] = self.add_newlines(self.text_index, 75)
+        self.text_label.config(text=wrapped)
 
-    def add_newlines(self, text, n):
-        n = self.count_upper_case(text, n)
+    def add_newlines(self, index, n):
+        text = self.text[index]
+        n = self.line_width(index, n)
 
         if len(text) < n:
             return text
 
-        form_text = ""
-        for word in text.split(" "):
-            if len(word) > n:
-                word = word[:n] + "\n" + word[n:]
-            form_text += word + " "
-
-        offset = 0
-        try:
-            while True:
-                p = form_text.rindex(" ", offset, offset + n)
-                form_text = form_text[:p] + "\n" + form_text[p + 1:]
-                offset = p
-                if len(form_text[p + 1:]) < n:
-                    return form_text
-        except ValueError:
-            pass
-        return form_text
+        # Zeilenumbruch nach spätestens n Zeichen, nur an Leerzeichen; zu lange Wörter werden getrennt.
+        # Vorhandene Zeilenumbrüche bleiben erhalten, jede Zeile wird für sich umgebrochen.
+        lines = []
+        for segment in text.splitlines():
+            lines.extend(textwrap.wrap(segment, width=n, break_long_words=True, break_on_hyphens=False,
+                                       replace_whitespace=False) or [""])
+        return "\n".join(lines)
     
-    def count_upper_case(self, text, n):
-        count_upper_case = 0 
-        for char in text:
-            if char.isupper():
-                count_upper_case += 1
-        if count_upper_case >= len(text) // 2:
-            n = int(n * 0.75)
-        
-        return n
+    def line_width(self, index, n):
+        # Zeichen pro Zeile für den Text; überwiegend Großbuchstaben brauchen mehr Platz.
+        return int(n * 0.75) if self.upper_heavy[index] else n
 
     def entry_input_cmd(self, event=None):
         if len(self.var_input.get()) == 0:
@@ -274,176 +368,227 @@ class RateFrame(ContainerFrame):
         # Die Eingabe im Entry-Feld zurücksetzen, nachdem die Bewertung gespeichert wurde
         self.var_input.delete(0, "end")
 
-    def cat_hotkey_cmd(self, event):
-        category_no = int(event.char) - 1
+    def category_hotkey_cmd(self, category_no, event=None):
+        # Nur bei Nominal- oder Ordinaldaten und nur für Kategorien der aktuellen Session.
+        # Bei Intervall- oder Rationaldaten wird die Ziffer im Entry-Feld eingegeben.
+        if self.is_numeric or category_no >= len(self.container.categories):
+            return
 
+        self.set_category(self.container.categories[category_no])
+
+    def set_category(self, category):
         # Wert der Variablen anpassen
-        self.categories_var.set(self.container.categories[category_no])
+        self.categories_var.set(category)
 
         # Das Rating in der Datenstruktur setzen und den Navigationsframe auf der linken Seite anpassen.
         self.label_text()
 
     def next_cmd(self, event=None):
+        self.goto(1)
+
+    def prev_cmd(self, event=None):
+        self.goto(-1)
 
+    def goto(self, delta):
         self.focus_set() # Für Zugriff auf Key-Bindings von left- und right-arrow
-        if self.text_index == len(self.text) - 1:
-            # User ist am Ende der Fragen angekommen.
-            return 
-        else:
-            self.text_index = self.text_index + 1
-            self.populate_text()
-            if self.ratings[self.text_index] != (): 
-                self.categories_var.set(self.ratings[self.text_index][RATING])
+        new_index = self.text_index + delta
+        if not 0 <= new_index < len(self.text):
+            # User ist am Anfang, bzw. am Ende der Fragen angekommen.
+            return
 
-                if self.container.scale_format == "intervall" or self.container.scale_format == "ratio":
+        self.text_index = new_index
+        self.populate_text()
+        self.sync_rating_widgets()
 
-                    self.var_entered.config(text=self.categories_var.get())
-            else:
-                # Vorherige Auswahl vom anderen Textelement im Radiobutton in GUI resetten
-                self.categories_var.set("")
+        # Navigation-Treeview anpassen
+        self.focus_child(self.text_index)
 
-                if self.container.scale_format == "intervall" or self.container.scale_format == "ratio":
-                    # Bei Intervall- oder Rationaldaten zusätzlich n.a. im Label anzeigen
-                    self.var_entered.config(text="n.a.")
-
-            # Navigation-Treeview anpassen
-            # Passendes-Parent-Item öffnen / schließen
-            parent_iid = "parent_" + str(self.text_index // 10)
-            self.text_preview.item(parent_iid, open=True)
-            # Alle anderen Parent-Items schließen
-            for i in range(math.ceil(len(self.text) / 10)):
-                other_parent_iid = "parent_" + str(i)
-                if other_parent_iid != parent_iid:
-                    self.text_preview.item(other_parent_iid, open=False)
-
-            # Child-Item hervorheben
-            child_iid = "child_" + str(self.text_index)
-            self.text_preview.focus(child_iid)
-            self.text_preview.selection_set(child_iid)
+    def sync_rating_widgets(self):
+        if self.rated[self.text_index]:
+            # Es wurde bereits ein Rating für das Element gesetzt.
+            # Das soll in den Radiobuttons angezeigt werden.
+            self.categories_var.set(self.ratings[self.text_index][RATING])
 
-            #TODO write to tmp-file for autosave
+            if self.is_numeric:
+                # Bei Intervall- oder Rationaldaten zusätzlich im Label anzeigen welcher Wert bereits
+                # gesetzt wurde
+                self.var_entered.config(text=self.categories_var.get())
+        else:
+            # Vorherige Auswahl vom anderen Textelement im Radiobutton in GUI resetten
+            self.categories_var.set("")
 
-    def prev_cmd(self, event=None):
+            if self.is_numeric:
+                # Bei Intervall- oder Rationaldaten zusätzlich n.a. im Label anzeigen
+                self.var_entered.config(text="n.a.")
 
-        self.focus_set() # Für Zugriff auf Key-Bindings von left- und right-arrow
-        if self.text_index == 0:
-            return 
-        else:
-            self.text_index = self.text_index - 1
-            self.populate_text()
-            if self.ratings[self.text_index] != (): 
-                # Es wurde bereits ein Rating für die vorherige Frage gesetzt.
-                # Das soll in den Radiobuttons angezeigt werden.
-                self.categories_var.set(self.ratings[self.text_index][RATING])
-
-                if self.container.scale_format == "intervall" or self.container.scale_format == "ratio":
-                    # Bei Intervall- oder Rationaldaten zusätzlich im Label anzeigen welcher Wert bereits
-                    # gesetzt wurde
-                    self.var_entered.config(text=self.categories_var.get())
-            else:
-                self.categories_var.set("") # Radiobutton resetten
-
-                if self.container.scale_format == "intervall" or self.container.scale_format == "ratio":
-                    self.var_entered.config(text="n.a.")
-            
-            parent_iid = "parent_" + str(self.text_index // 10)
-            self.text_preview.item(parent_iid, open=True)
-            for i in range(math.ceil(len(self.text) / 10)):
-                other_parent_iid = "parent_" + str(i)
-                if other_parent_iid != parent_iid:
-                    self.text_preview.item(other_parent_iid, open=False)
-
-            child_iid = "child_" + str(self.text_index)
-            self.text_preview.focus(child_iid)
-            self.text_preview.selection_set(child_iid)
+    def focus_child(self, index):
+        # Passendes Parent-Item öffnen. Nur das zuvor geöffnete Parent-Item wird geschlossen,
+        # statt über alle Parent-Items zu iterieren.
+        self.switch_open_parent(index // 10)
+        self.text_preview.item(self.parent_iids[self.open_parent], open=True)
 
+        # Child-Item hervorheben
+        child_iid = self.child_iids[index]
+        self.text_preview.focus(child_iid)
+        self.text_preview.selection_set(child_iid)
 
     def save_cmd(self):
-        if self.shuffler is not None:
-            self.randomize("undo")
-
         self.focus_set()
-        filename = tk.filedialog.asksaveasfilename(filetypes=[
-            ("Excel files", ".xlsx .xls"), 
-            ("Libreoffice Calc files", ".ods"),
-            ("Csv files", ".csv")
-            ])
-        
-        self.container.filevalidation.write_file(filename, self.ratings)
+        filename = filedialog.asksaveasfilename(filetypes=FILE_TYPES)
+        if filename == "":
+            return
+
+        self.container.filevalidation.write_file(filename, self.original_order_ratings())
+        # Nach dem Speichern wird die Sicherungskopie nicht mehr benötigt.
+        self.remove_autosave()
+
+    def original_order_ratings(self):
+        # Bewertungen in der ursprünglichen Reihenfolge, ohne die Reihenfolge im Frame zu ändern.
+        if self.shuffler is None:
+            return self.ratings
+        return permute(self.ratings, self.undo_shuffler.tolist())
 
     def delete_cmd(self):
         self.focus_set()
         result = messagebox.askyesno(title="Verwerfen", message="Die gesamte Bewertungssession verwerfen?")
         if result:
+            self.remove_autosave()
             self.categories_var.set("")
-            self.ratings = []
-            for text_entry in self.text:
-                self.ratings.append(())
-
-                self.text_index = 0
-                self.update_frame()
+            self.total_ratings = 0
+            self.text_index = 0
+
+            # Eine zufällige Reihenfolge wird beim Neuaufbau beibehalten.
+            mode = "do" if self.shuffler is not None else None
+            self.shuffler = None
+            self.undo_shuffler = None
+            self.update_frame(mode)
         else:
             return
 
     def label_text(self, event=None):
         self.focus_set()
+        self.schedule_autosave()
+        # Falls der Parent-Node zugeklappt wurde, ihn für die Aktualisierung wieder öffnen.
+        self.focus_child(self.text_index)
 
-        if self.ratings[self.text_index]:
+        if self.rated[self.text_index]:
             if self.ratings[self.text_index][RATING] == self.categories_var.get():
                 self.ratings[self.text_index] = ()
+                self.rated[self.text_index] = False
                 self.categories_var.set("")
                 self.total_ratings -= 1
-                self.populate_percentage()
-
-                child_iid = "child_" + str(self.text_index)
-                self.text_preview.item(child_iid, tags=(self.text_preview.item(child_iid, "tags")[0]))
-                self.text_preview.item(child_iid, values=(self.text_preview.item(child_iid, "values")[0].replace(" ✓", ""),))
-                parent_iid = self.text_preview.parent(child_iid)
-                values = self.text_preview.item(parent_iid, "values")
-                values = (values[0].replace("     ✓", ""),)
-                self.text_preview.item(parent_iid, values=values)
+                self.schedule_percentage()
+
+                # Die Texte der Zeilen sind in Python bekannt und werden nicht erst aus dem Treeview gelesen.
+                child_iid = self.child_iids[self.text_index]
+                self.text_preview.item(child_iid, tags=("unselected",), values=(self.nav_labels[self.text_index],))
+
+                # Häckchen beim Parent nur entfernen, falls vorher alle Child-Elemente gelabeled waren.
+                parent = self.text_index // 10
+                if self.bucket_remaining[parent] == 0:
+                    self.text_preview.item(self.parent_iids[parent], values=(self.parent_labels[parent],))
+                self.bucket_remaining[parent] += 1
             else:
                 # Wurde bereits gelabeld; nur der Wert wird geändert
                 self.ratings[self.text_index] = (self.container.dbinteraction.active_profile, self.categories_var.get())
         else:
             # Kategorieauswahl, sowie Profil in der Ratings-Liste speichern.
             self.ratings[self.text_index] = (self.container.dbinteraction.active_profile, self.categories_var.get())
+            self.rated[self.text_index] = True
             #TODO checken, ob neue Auswahl gemacht wurde
             self.total_ratings += 1
-            #TODO Falls was abgewählt wird total_ratings dekrementieren
 
-            self.populate_percentage()
+            self.schedule_percentage()
 
-            # Häckchen im Navigation-Treeview hinzufügen
-            child_iid = "child_" + str(self.text_index)
+            # Häckchen im Navigation-Treeview hinzufügen. Die Zeile war bisher unbewertet,
+            # Tags und Values werden daher ohne vorheriges Auslesen mit einem Aufruf gesetzt.
+            child_iid = self.child_iids[self.text_index]
+            self.text_preview.item(child_iid, tags=("unselected", "labeled"),
+                                   values=(self.nav_labels[self.text_index] + " ✓",))
 
-            # Gibt die Tags, bzw values vom Child-Element
-            tags = self.text_preview.item(child_iid, "tags")
-            values = self.text_preview.item(child_iid, "values")
-
-            if "labeled" not in tags:
-                tags += ("labeled",)
-                values = (values[0] + " ✓",)
+            self.text_preview.selection_set(child_iid)
 
-            self.text_preview.item(child_iid, tags=tags)
-            self.text_preview.item(child_iid, values=values)
+            # Falls alle Child-Elemente gelabeled wurden, setze Häckchen beim Parent.
+            # Der Zähler pro Parent-Node ersetzt die Abfrage aller Child-Elemente.
+            parent = self.text_index // 10
+            self.bucket_remaining[parent] -= 1
+            if self.bucket_remaining[parent] > 0:
+                return
 
-            self.text_preview.selection_set(child_iid)
+            self.text_preview.item(self.parent_iids[parent], values=(self.parent_labels[parent] + "     ✓",))
 
-            # Falls alle Child-Elemente gelabeled wurden, setze Häckchen beim Parent
-            parent_iid = self.text_preview.parent(child_iid)
-            for child_iid in self.text_preview.get_children(parent_iid):
-                tags = self.text_preview.item(child_iid, "tags")
-                if "labeled" not in tags:
-                    return
-            
-            values = self.text_preview.item(parent_iid, "values")
-            values = (values[0] + "     ✓",)
-            self.text_preview.item(parent_iid, values=values)
-
-            self.update()
+            self.update_idletasks()     # Nur ausstehende Zeichenvorgänge ausführen, keine neuen Events verarbeiten.
             self.labeling_finished()
 
+    def schedule_autosave(self):
+        # Autosave wird nur einmal pro Intervall geplant, egal wie viele Bewertungen in der Zeit abgegeben werden.
+        if self.autosave_id is None:
+            self.autosave_id = self.after(AUTOSAVE_DELAY, self.autosave)
+
+    def schedule_percentage(self):
+        # Die Prozentanzeige wird erst aktualisiert, wenn Tk untätig ist. Mehrere schnell aufeinander
+        # folgende Bewertungen führen so nur zu einer Aktualisierung.
+        if self.percentage_id is None:
+            self.percentage_id = self.after_idle(self.flush_percentage)
+
+    def flush_percentage(self):
+        self.percentage_id = None
+        self.populate_percentage()
+
+    def autosave(self):
+        self.autosave_id = None
+        if self.autosave_path is None:
+            return
+
+        # Nur die Bewertungen als JSON sichern, statt die gesamte Datei über write_file zu exportieren.
+        # Profil und Datei werden mitgespeichert, damit die Sicherungskopie zuordenbar ist.
+        data = {
+            "profile": self.profile,
+            "file": self.container.filevalidation.file,
+            "scale_format": self.container.scale_format,
+            "ratings": self.original_order_ratings(),
+        }
+        temp_path = self.autosave_path + ".tmp"
+        try:
+            os.makedirs(AUTOSAVE_DIR, exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            # Erst nach vollständigem Schreiben ersetzen, damit keine halb geschriebene Sicherung zurückbleibt.
+            os.replace(temp_path, self.autosave_path)
+        except (OSError, ValueError) as e:
+            print("Exception in autosave:" + str(e))
+
+    def remove_autosave(self):
+        # Ausstehenden Autosave abbrechen und die Sicherungskopie löschen.
+        if self.autosave_id is not None:
+            self.after_cancel(self.autosave_id)
+            self.autosave_id = None
+        if self.autosave_path is None:
+            return
+        try:
+            if os.path.exists(self.autosave_path):
+                os.remove(self.autosave_path)
+        except OSError as e:
+            print("Exception in remove_autosave:" + str(e))
+
+    def destroy(self):
+        # Ausstehenden Autosave sofort ausführen statt verwerfen, z.B. beim Verlassen über Home ohne
+        # Speichern oder beim Schließen des Fensters. Ausstehende Aktualisierungen abbrechen.
+        if self.autosave_id is not None:
+            self.after_cancel(self.autosave_id)
+            self.autosave()
+        if self.percentage_id is not None:
+            self.after_cancel(self.percentage_id)
+            self.percentage_id = None
+        super().destroy()
+
+    def get_autosave_path(self):
+        # Eigene Sicherungskopie pro Profil und Datei, damit sich Sessions nicht gegenseitig überschreiben.
+        if self.container.filevalidation is None:
+            return None
+        session_key = f"{self.profile}\n{os.path.abspath(self.container.filevalidation.file)}"
+        return os.path.join(AUTOSAVE_DIR, "autosave_" + hashlib.sha1(session_key.encode("utf-8")).hexdigest() + ".json")
+
     def labeling_finished(self):
         if self.total_ratings == len(self.text):
             # Falls alle Fragen beantwortet worde sind, fragen ob er speichern will.
@@ -452,20 +597,18 @@ class RateFrame(ContainerFrame):
                 self.save_cmd()
 
     def populate_percentage(self):
-        percentage = int(100 * self.total_ratings / len(self.text))
-        percentage_str = str(int(100 * self.total_ratings / len(self.text))) + " %"
-        self.percent_label.config(text=percentage_str)
-
-        if percentage < 20:
-            self.percent_label.config(style="Red.TLabel")
-        elif percentage < 40:
-            self.percent_label.config(style="Orange.TLabel")
-        elif percentage < 60:
-            self.percent_label.config(style="Yellow.TLabel")
-        elif percentage < 80:
-            self.percent_label.config(style="Lightgreen.TLabel")
-        else:
-            self.percent_label.config(style="Green.TLabel")
+        percentage = 100 * self.total_ratings // len(self.text)
+        text = f"{percentage} %"
+        style = PERCENT_STYLES[min(percentage // 20, 4)]
+
+        # Nur geänderte Optionen an Tk übergeben.
+        changes = {}
+        if text != self.percent_text:
+            changes["text"] = self.percent_text = text
+        if style != self.percent_style:
+            changes["style"] = self.percent_style = style
+        if changes:
+            self.percent_label.config(**changes)
 
     def home_cmd(self):
         result = messagebox.askyesno(title="Speichern?", message="Soll die Bewertungssession gespeichert werden?")
@@ -477,22 +620,39 @@ class RateFrame(ContainerFrame):
         self.container.show_frame("MainFrame")
 
     def help_cmd(self,event=None):
-        RateHelpFrame(self.container)
+        RateHelpFrame.show(self.container)
 
     def update_frame(self, mode=None):
         self.focus_set() # Für Zugriff auf Key-Bindings von left- und right-arrow
         self.text = self.container.formatted_text
-        for text_entry in self.text:
-            # Liste mit leeren Tupeln füllen, da noch kein Rating gesetzt.
-            self.ratings.append(())
+        self.profile = self.container.dbinteraction.active_profile
+        self.autosave_path = self.get_autosave_path()
+        self.compute_nav_labels()
+        self.wrapped_text = [None] * len(self.text)
+        self.child_iids = [f"child_{i}" for i in range(len(self.text))]
+        self.parent_iids = [f"parent_{i}" for i in range((len(self.text) + 9) // 10)]
+        self.parent_index = {parent_iid: i for i, parent_iid in enumerate(self.parent_iids)}
+        # Das Skalenformat ändert sich während einer Bewertungssession nicht.
+        self.is_numeric = self.container.scale_format in ("intervall", "ratio")
+        # Liste mit leeren Tupeln füllen, da noch kein Rating gesetzt.
+        self.ratings = [()] * len(self.text)
+        self.rated = np.zeros(len(self.text), dtype=bool)
+        # Zu Beginn ist kein Element bewertet; der letzte Parent-Node kann weniger als 10 Elemente haben.
+        self.bucket_remaining = np.bincount(np.arange(len(self.text)) // 10).astype(np.int16)
         
         if mode == "do":
             self.randomize(mode)
 
-        self.delete_categories()
-        self.populate_categories()
+        # Kategorie-Widgets nur neu erzeugen, wenn sich Skalenformat oder Kategorien geändert haben,
+        # z.B. nicht beim Verwerfen der Bewertungssession.
+        category_layout = (self.container.scale_format, tuple(self.container.categories))
+        if category_layout != self.category_layout:
+            self.delete_categories()
+            self.populate_categories()
+            self.category_layout = category_layout
         self.delete_questions()
         self.populate_navigation()
         self.populate_text()
+        self.sync_rating_widgets()
         self.populate_percentage()
         
\ No newline at end of file